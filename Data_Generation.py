@@ -1,25 +1,111 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
 from datetime import datetime
 import time
+import re
 from core.auth_manager import auth_manager
-from core.data_generation_orchestrator import DataGenerationOrchestrator
-from core.guardrails import GuardrailsManager
+from core.ai_client import AIClient
+from core.data_generation_orchestrator import DataGenerationOrchestrator, get_database_manager, parse_ddl_cached
 from core.observability import observability
+from utils.ai_response_cache import AIResponseCache
 from utils.export_handlers import ExportManager
-from utils.visualization import VisualizationManager
+from utils.table_store import TableStore
+from utils.dataframe_utils import compact_dataframe, coerce_numeric_like, expand_categories
 from config.settings import settings
 
-# Initialize managers
-guardrails = GuardrailsManager()
-export_manager = ExportManager()
-viz_manager = VisualizationManager()
+# Case-insensitive check for SQL statements in uploaded schema files
+SQL_KEYWORDS_PATTERN = re.compile(rb'(?i)CREATE|TABLE|INSERT|ALTER|DROP')
+
+# Rows sent to the browser per table preview until the user asks for more
+PREVIEW_ROWS = 200
+
+# Edit prompts that ask for no changes and can skip the AI round-trip
+NO_OP_EDIT_PROMPTS = {"", "no change", "no changes", "noop", "no-op", "none", "nothing"}
+
+# Cached resources - reused across Streamlit reruns instead of rebuilt on every interaction
+@st.cache_resource
+def get_ai_client():
+    """Get shared AI client"""
+    return AIClient()
+
+@st.cache_resource
+def get_ai_response_cache():
+    """Get persistent cache of AI edit responses"""
+    return AIResponseCache(settings.AI_CACHE_DIR)
+
+@st.cache_resource
+def get_export_manager():
+    """Get shared export manager"""
+    return ExportManager()
+
+@st.cache_data(show_spinner=False)
+def build_schema_info(ddl_content):
+    """Parse DDL into the schema info used for query generation (cached per DDL text)"""
+    parsed_tables = parse_ddl_cached(ddl_content)
+    # One list per column attribute
+    return {
+        table.name: {
+            'names': [col.name for col in table.columns],
+            'types': [col.data_type.value for col in table.columns],
+            'nullables': [col.nullable for col in table.columns],
+            'primary_key': table.primary_keys,
+            'foreign_keys': table.foreign_keys
+        }
+        for table in parsed_tables
+    }
+
+def _hash_dataframe(df):
+    """Cheap content fingerprint used to key cached exports"""
+    return (tuple(df.columns), int(pd.util.hash_pandas_object(df).sum()))
+
+@st.cache_data(hash_funcs={pd.DataFrame: _hash_dataframe}, show_spinner=False)
+def build_csv_export(tables):
+    """Build the combined CSV export; rebuilt only when a table changes"""
+    return get_export_manager().create_csv_export(dict(tables))
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def table_memory_kb(table_key, _df):
+    """Deep memory usage in KB; keyed on table_fingerprint so the DataFrame itself is not hashed"""
+    return _df.memory_usage(deep=True).sum() / 1024
+
+def table_fingerprint(table_name, df):
+    """Key that changes on every edit: the stored Parquet version, else a full content hash"""
+    store = st.session_state.get("generated_tables")
+    version = store.version(table_name) if isinstance(store, TableStore) else None
+    return version or (table_name, *_hash_dataframe(df))
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def preview_arrow_table(table_key, _df):
+    """Arrow copy of a table for previews; converted once and sliced without copying on reruns"""
+    return pa.Table.from_pandas(_df, preserve_index=False)
 
 # Log application startup
 observability.log_info("🚀 Streamlit application starting")
 
 # Helper functions
 
+def replace_generated_tables(tables=None):
+    """Swap the session's generated tables, deleting the previous store's files"""
+    previous = st.session_state.pop("generated_tables", None)
+    if isinstance(previous, TableStore):
+        previous.close()
+    if tables is not None:
+        st.session_state["generated_tables"] = TableStore.from_tables(tables)
+
+@st.cache_data(show_spinner=False)
+def describe_table_for_prompt(df):
+    """Format the table metadata used in edit prompts (cached per table content)"""
+    return {
+        "id_columns": tuple(col for col in df.columns if col.endswith('_id') and pd.api.types.is_integer_dtype(df[col])),
+        "dtypes": df.dtypes.to_string(),
+        "columns": list(df.columns),
+        "header": ','.join(df.columns),
+        "sample": df.head().to_string(),
+        "example_row": df.head(1).to_csv(header=False, index=False).strip()
+    }
+
 def process_table_edit(table_name, edit_prompt):
     """Process table edit request using AI"""
     try:
@@ -30,29 +116,35 @@ def process_table_edit(table_name, edit_prompt):
         
         original_df = st.session_state["generated_tables"][table_name]
         
+        # Skip the AI call entirely for requests that ask for no changes
+        if edit_prompt.strip().lower().rstrip('.!') in NO_OP_EDIT_PROMPTS:
+            st.info(f"ℹ️ No changes requested for {table_name}.")
+            return original_df
+        
         # Identify which columns are ID columns that should be preserved
-        id_columns = [col for col in original_df.columns if col.endswith('_id') and original_df[col].dtype == 'int64']
+        table_info = describe_table_for_prompt(original_df)
+        id_columns = table_info["id_columns"]
         
         # Create AI prompt for data modification
         ai_prompt = f"""
 You are a data modification expert. I have a table called '{table_name}' with the following structure and data:
 
 Table Structure:
-{original_df.dtypes.to_string()}
+{table_info["dtypes"]}
 
 EXACT COLUMN ORDER (CRITICAL - MUST FOLLOW THIS ORDER):
-{list(original_df.columns)}
+{table_info["columns"]}
 
 Total Rows: {len(original_df)}
 Current Data (first 5 rows as sample):
-{original_df.head().to_string()}
+{table_info["sample"]}
 
 User Request: {edit_prompt}
 
 Please modify the data according to the user's request. Return the modified data as a CSV format that I can parse back into a pandas DataFrame. 
 
 CRITICAL REQUIREMENTS:
-1. The CSV header row MUST be: {','.join(original_df.columns)}
+1. The CSV header row MUST be: {table_info["header"]}
 2. Each data row MUST have values in the EXACT same order as the columns above
 3. MUST keep exactly {len(original_df)} rows (same as original) unless user specifically requests to change the number of rows
 4. The sample above shows only the first 5 rows - you need to generate {len(original_df)} total rows
@@ -63,7 +155,7 @@ CRITICAL REQUIREMENTS:
 9. For comma-separated lists (like awards, genres), wrap the entire field in quotes: "Award 1, Award 2, Award 3"
 
 SPECIAL COLUMN HANDLING:
-- ID COLUMNS TO PRESERVE: {id_columns} - Keep these EXACTLY as they are in the original data (sequential integers 1, 2, 3, etc.)
+- ID COLUMNS TO PRESERVE: {list(id_columns)} - Keep these EXACTLY as they are in the original data (sequential integers 1, 2, 3, etc.)
 - MODIFYABLE COLUMNS: All other columns can be modified according to the user's request
 
 DATA TYPE REQUIREMENTS:
@@ -76,8 +168,8 @@ DATA TYPE REQUIREMENTS:
 - For TEXT columns: Use string values
 
 EXAMPLE FORMAT (first row only):
-{','.join(original_df.columns)}
-{','.join([str(original_df.iloc[0][col]) for col in original_df.columns])}
+{table_info["header"]}
+{table_info["example_row"]}
 
 IMPORTANT CSV FORMATTING EXAMPLE:
 If you have fields with commas, quotes, or special characters, format them like this:
@@ -88,12 +180,20 @@ author_id,first_name,last_name,awards,genres
 Modified CSV data:
 """
         
-        # Initialize AI client and process the request
-        from core.ai_client import AIClient
-        ai_client = AIClient()
+        # Reuse a previous response for the same table state and request
+        temperature = 0.3
+        response_cache = get_ai_response_cache()
+        cache_key = response_cache.build_key(table_name, original_df, edit_prompt, temperature)
+        response = response_cache.get(cache_key)
         
-        with st.spinner(f"🤖 AI is modifying {table_name}..."):
-            response = ai_client.generate_content(ai_prompt, temperature=0.3)
+        if response:
+            observability.log_info("Using cached AI response for table edit", table=table_name)
+        else:
+            # Get the shared AI client and process the request
+            ai_client = get_ai_client()
+            
+            with st.spinner(f"🤖 AI is modifying {table_name}..."):
+                response = ai_client.generate_content(ai_prompt, temperature=temperature)
         
         if not response:
             st.error("❌ AI modification failed. Please try again.")
@@ -102,29 +202,36 @@ Modified CSV data:
         # Parse the AI response as CSV
         try:
             import io
-            import pandas as pd
             
             # Clean the response (remove any markdown formatting)
             csv_data = response.strip()
             if csv_data.startswith('```'):
-                # Remove markdown code blocks
-                lines = csv_data.split('\n')
-                csv_data = '\n'.join([line for line in lines if not line.startswith('```')])
+                # Remove markdown code fence lines in a single pass
+                csv_data = re.sub(r'(?m)^```[^\n]*\n?', '', csv_data)
             
             # Parse CSV with error handling and proper quoting
             try:
-                modified_df = pd.read_csv(io.StringIO(csv_data), quotechar='"', escapechar='\\')
-            except pd.errors.ParserError as csv_error:
-                st.warning(f"⚠️ CSV parsing error: {csv_error}. Attempting to fix...")
-                # Try with more flexible parsing
+                # Fast path: multithreaded Arrow parser; NumPy dtypes keep NaN handling in the fallbacks below intact
+                modified_df = pd.read_csv(io.BytesIO(csv_data.encode('utf-8')), engine='pyarrow',
+                                          quotechar='"', escapechar='\\')
+            except Exception as arrow_error:
+                observability.log_debug(f"PyArrow CSV parsing failed, falling back to default parser: {arrow_error}")
+                modified_df = None
+            
+            if modified_df is None:
                 try:
-                    modified_df = pd.read_csv(io.StringIO(csv_data), quotechar='"', escapechar='\\', on_bad_lines='skip')
-                except Exception as e2:
-                    st.error(f"❌ Could not parse CSV even with flexible parsing: {e2}")
-                    # Show the problematic data for debugging
-                    st.error("Problematic CSV data:")
-                    st.code(csv_data[:1000] + "..." if len(csv_data) > 1000 else csv_data)
-                    return None
+                    modified_df = pd.read_csv(io.StringIO(csv_data), quotechar='"', escapechar='\\')
+                except pd.errors.ParserError as csv_error:
+                    st.warning(f"⚠️ CSV parsing error: {csv_error}. Attempting to fix...")
+                    # Try with more flexible parsing
+                    try:
+                        modified_df = pd.read_csv(io.StringIO(csv_data), quotechar='"', escapechar='\\', on_bad_lines='skip')
+                    except Exception as e2:
+                        st.error(f"❌ Could not parse CSV even with flexible parsing: {e2}")
+                        # Show the problematic data for debugging
+                        st.error("Problematic CSV data:")
+                        st.code(csv_data[:1000] + "..." if len(csv_data) > 1000 else csv_data)
+                        return None
             
             # Validate that the structure matches
             if list(modified_df.columns) != list(original_df.columns):
@@ -136,18 +243,15 @@ Modified CSV data:
                 modified_df = modified_df[original_df.columns]
             
             # Additional validation: Check if ID columns are preserved correctly
-            for col in original_df.columns:
-                if col.endswith('_id') and original_df[col].dtype == 'int64':
+            for col in id_columns:
+                if col in modified_df.columns:
                     # Check if the first value in this column is actually an integer
                     try:
                         first_val = modified_df[col].iloc[0]
                         int(first_val)
                         
                         # Check if ID values are preserved (should be sequential 1, 2, 3, etc.)
-                        original_ids = original_df[col].tolist()
-                        modified_ids = modified_df[col].tolist()
-                        
-                        if original_ids != modified_ids:
+                        if not np.array_equal(original_df[col].to_numpy(), modified_df[col].to_numpy()):
                             st.warning(f"⚠️ ID column '{col}' values were changed. Restoring original ID values...")
                             modified_df[col] = original_df[col]
                             
@@ -161,27 +265,34 @@ Modified CSV data:
             if len(modified_df) != len(original_df):
                 st.warning(f"⚠️ Row count mismatch. Expected {len(original_df)}, got {len(modified_df)}. Adjusting...")
                 if len(modified_df) < len(original_df):
-                    # Pad with original data
+                    # Pad with original data by extending the index and filling the new rows in place
                     missing_rows = len(original_df) - len(modified_df)
-                    padding_df = original_df.tail(missing_rows).copy()
-                    modified_df = pd.concat([modified_df, padding_df], ignore_index=True)
+                    modified_df = modified_df.reset_index(drop=True).reindex(range(len(original_df)))
+                    modified_df.iloc[-missing_rows:, :] = original_df.iloc[-missing_rows:].to_numpy()
                 else:
                     # Truncate to match original
-                    modified_df = modified_df.head(len(original_df))
+                    modified_df = modified_df.iloc[:len(original_df)]
             
             # Ensure data types match with better error handling
             for col in original_df.columns:
                 if col in modified_df.columns:
                     try:
                         # Special handling for different data types
-                        if original_df[col].dtype == 'int64':
-                            # Try to convert to int, handle non-numeric values
-                            modified_df[col] = pd.to_numeric(modified_df[col], errors='coerce').fillna(original_df[col]).astype('int64')
-                        elif original_df[col].dtype == 'float64':
-                            modified_df[col] = pd.to_numeric(modified_df[col], errors='coerce').fillna(original_df[col]).astype('float64')
-                        elif original_df[col].dtype == 'bool':
-                            # Handle boolean conversion
-                            modified_df[col] = modified_df[col].astype(str).str.lower().map({'true': True, 'false': False}).fillna(original_df[col])
+                        if pd.api.types.is_bool_dtype(original_df[col]):
+                            # Handle boolean conversion - one vectorized comparison for text columns
+                            values = modified_df[col].to_numpy()
+                            if values.dtype.kind in 'UOS':
+                                lowered = np.char.lower(values.astype(str))
+                                modified_df[col] = np.where(lowered == 'true', True,
+                                                            np.where(lowered == 'false', False, original_df[col].to_numpy()))
+                            else:
+                                modified_df[col] = modified_df[col].astype(str).str.lower().map({'true': True, 'false': False}).fillna(original_df[col])
+                        elif pd.api.types.is_integer_dtype(original_df[col]) or pd.api.types.is_float_dtype(original_df[col]):
+                            # Non-numeric values fall back to the original; numeric columns are downcast again by compact_dataframe below
+                            modified_df[col] = coerce_numeric_like(modified_df[col], original_df[col])
+                        elif isinstance(original_df[col].dtype, pd.CategoricalDtype):
+                            # Rebuild categories - the AI may have introduced new values
+                            modified_df[col] = modified_df[col].astype(str).astype('category')
                         else:
                             # For string and other types, try direct conversion
                             modified_df[col] = modified_df[col].astype(original_df[col].dtype)
@@ -189,8 +300,11 @@ Modified CSV data:
                         st.warning(f"⚠️ Could not convert column '{col}' to {original_df[col].dtype}. Using original data.")
                         modified_df[col] = original_df[col]
             
+            # Only cache responses that parsed successfully
+            response_cache.set(cache_key, response)
+            
             st.success(f"✅ Successfully modified {table_name} with AI!")
-            return modified_df
+            return compact_dataframe(modified_df)
             
         except Exception as parse_error:
             st.error(f"❌ Failed to parse AI response as CSV: {str(parse_error)}")
@@ -323,9 +437,7 @@ def generate_data_workflow_from_ddl(instructions, temperature, num_records, ddl_
             
             # Create tables in PostgreSQL and store data
             with st.spinner("Creating tables in PostgreSQL and storing data..."):
-                from core.database_manager import DatabaseManager
-                
-                db_manager = DatabaseManager()
+                db_manager = get_database_manager()
                 # Create tables from DDL with drop_existing option
                 table_creation_success = db_manager.create_tables_from_ddl(ddl_content, drop_existing=drop_existing)
                 
@@ -333,51 +445,37 @@ def generate_data_workflow_from_ddl(instructions, temperature, num_records, ddl_
                     st.error("❌ Failed to create database tables. Cannot proceed with data insertion.")
                     return
                 
-                # Store generated data in PostgreSQL with proper dependency order
-                insertion_results = db_manager.store_generated_data(generated_data, ddl_content)
+                # Store generated data in PostgreSQL with proper dependency order, advancing a progress bar per table
+                insertion_progress = st.progress(0.0, text="Inserting data...")
+                inserted_tables = []
                 
-                # Check insertion results
-                successful_tables = [table for table, success in insertion_results.items() if success]
-                failed_tables = [table for table, success in insertion_results.items() if not success]
+                def report_insertion(table_name: str, success: bool):
+                    # Nothing is committed until every table is in, so completed tables are only staged
+                    inserted_tables.append(table_name)
+                    insertion_progress.progress(len(inserted_tables) / len(generated_data),
+                                                text=f"{'⏳ Staged' if success else '❌ Failed'} {table_name}")
                 
-                if failed_tables:
-                    if successful_tables:
-                        st.warning(f"⚠️ **Partial Success**: {len(successful_tables)}/{len(insertion_results)} tables inserted successfully")
-                        st.error(f"❌ **Failed Tables**: {', '.join(failed_tables)}")
-                        st.info("💡 **Tip**: Try running the data generation again - the system will now properly handle table recreation.")
-                        
-                        # Only store successfully inserted tables in session state
-                        successful_data = {table: generated_data[table] for table in successful_tables if table in generated_data}
-                        st.session_state["generated_tables"] = successful_data
-                    else:
-                        st.error(f"❌ **All Tables Failed**: None of the {len(insertion_results)} tables could be inserted")
-                        st.error(f"**Failed Tables**: {', '.join(failed_tables)}")
-                        st.info("💡 **Tip**: The tables may already exist with data. Try running the data generation again - the system will now properly handle table recreation.")
-                        
-                        # Don't store any data in session state if all insertions failed
-                        if "generated_tables" in st.session_state:
-                            del st.session_state["generated_tables"]
+                insertion_results = db_manager.store_generated_data(generated_data, ddl_content,
+                                                                    tables=list(parse_ddl_cached(ddl_content)),
+                                                                    on_progress=report_insertion)
+                insertion_progress.empty()
+                
+                # All tables are inserted in one transaction, so they are either all stored or all rolled back
+                if insertion_results and all(insertion_results.values()):
+                    replace_generated_tables({table: compact_dataframe(df) for table, df in generated_data.items()})
                 else:
-                    # All tables inserted successfully
-                    st.session_state["generated_tables"] = generated_data
+                    st.error(f"❌ **Insertion Rolled Back**: none of the {len(generated_data)} tables were stored")
+                    st.info("💡 **Tip**: The tables may already exist with data. Try running the data generation again - the system will now properly handle table recreation.")
+                    
+                    # Don't store any data in session state if the insertion was rolled back
+                    replace_generated_tables()
             
             # Store schema info for query generation
-            from core.ddl_parser import DDLParser
-            ddl_parser = DDLParser()
-            parsed_tables = ddl_parser.parse_ddl(ddl_content)
-            # Convert to schema info format for query generation
-            schema_info = {}
-            for table in parsed_tables:
-                schema_info[table.name] = {
-                    'columns': [{'name': col.name, 'type': col.data_type.value, 'nullable': col.nullable} for col in table.columns],
-                    'primary_key': table.primary_keys,
-                    'foreign_keys': table.foreign_keys
-                }
+            schema_info = build_schema_info(ddl_content)
             st.session_state["schema_info"] = schema_info
             
-            # Verify schema match for debugging
+            # Verify schema match for debugging (reusing the database manager from above)
             try:
-                db_manager = DatabaseManager()
                 if db_manager.is_connected():
                     verification_results = db_manager.verify_schema_match(schema_info)
                     # Log any mismatches
@@ -575,12 +673,11 @@ if uploaded_file:
                                         file_size=uploaded_file.size)
             st.error("File too large. Please upload a file smaller than 10MB.")
         else:
-            # Read and validate file content
-            file_content = uploaded_file.read().decode('utf-8')
+            # Read raw bytes - decoding is deferred until the content looks like SQL
+            file_bytes = uploaded_file.getvalue()
             
-            # Basic validation - check if it contains SQL keywords
-            sql_keywords = ['CREATE', 'TABLE', 'INSERT', 'ALTER', 'DROP']
-            has_sql_keywords = any(keyword in file_content.upper() for keyword in sql_keywords)
+            # Basic validation - check if it contains SQL keywords (single scan over the raw bytes)
+            has_sql_keywords = SQL_KEYWORDS_PATTERN.search(file_bytes) is not None
             
             if not has_sql_keywords:
                 observability.log_user_action("file_upload_warning",
@@ -588,6 +685,7 @@ if uploaded_file:
                                             filename=uploaded_file.name)
                 st.warning("⚠️ File doesn't appear to contain SQL statements. Please check your file.")
             else:
+                file_content = file_bytes.decode('utf-8')
                 observability.log_user_action("file_upload_success",
                                             filename=uploaded_file.name,
                                             file_size=uploaded_file.size,
@@ -680,7 +778,21 @@ if "generated_tables" in st.session_state and st.session_state["generated_tables
         with tab:
             # Display table data
             df = st.session_state["generated_tables"][table_name]
-            st.dataframe(df, width='stretch', hide_index=True)
+            
+            # Only render a window of rows so large tables are not serialized in full on every rerun
+            if len(df) > PREVIEW_ROWS:
+                window_size = st.slider(
+                    "Rows to display",
+                    min_value=PREVIEW_ROWS,
+                    max_value=len(df),
+                    value=PREVIEW_ROWS,
+                    key=f"nrows_{table_name}"
+                )
+                st.caption(f"Showing first {window_size} of {len(df)} rows")
+            else:
+                window_size = len(df)
+            preview = preview_arrow_table(table_fingerprint(table_name, df), df)
+            st.dataframe(preview.slice(0, window_size), width='stretch')
             
             # Table statistics
             col1, col2, col3 = st.columns(3)
@@ -689,7 +801,7 @@ if "generated_tables" in st.session_state and st.session_state["generated_tables
             with col2:
                 st.metric("Columns", len(df.columns))
             with col3:
-                st.metric("Memory", f"{df.memory_usage(deep=True).sum() / 1024:.1f} KB")
+                st.metric("Memory", f"{table_memory_kb(table_fingerprint(table_name, df), df):.1f} KB")
             
             # Edit interface for each table
             st.subheader(f"✏️ Modify {table_name}")
@@ -722,20 +834,29 @@ if "generated_tables" in st.session_state and st.session_state["generated_tables
                 st.write("**Interactive Data Editor**")
                 st.write("Edit the data directly in the table below:")
                 
-                # Use st.data_editor for interactive editing
+                # Use st.data_editor for interactive editing (category columns would only offer existing values)
                 edited_df = st.data_editor(
-                    df,
+                    expand_categories(df.iloc[:window_size]),
                     key=f"editor_{table_name}",
                     num_rows="dynamic",
                     width='stretch',
                     hide_index=True
                 )
                 
-                # Check if data was modified
-                if not edited_df.equals(df):
+                # Check if data was modified using the editor's change delta
+                editor_state = st.session_state.get(f"editor_{table_name}", {})
+                has_edits = bool(
+                    editor_state.get("edited_rows")
+                    or editor_state.get("added_rows")
+                    or editor_state.get("deleted_rows")
+                )
+                if has_edits:
                     col1, col2 = st.columns([1, 1])
                     with col1:
                         if st.button(f"💾 Save Changes to {table_name}", key=f"save_{table_name}"):
+                            # Rows beyond the displayed window are kept as they were
+                            if window_size < len(df):
+                                edited_df = pd.concat([edited_df, df.iloc[window_size:]], ignore_index=True)
                             st.session_state["generated_tables"][table_name] = edited_df
                             st.success(f"✅ Saved manual edits to {table_name}")
                             st.rerun()
@@ -753,7 +874,7 @@ if "generated_tables" in st.session_state and st.session_state["generated_tables
     with col1:
         # Direct CSV Download
         try:
-            csv_data = export_manager.create_csv_export(st.session_state["generated_tables"])
+            csv_data = build_csv_export(tuple(st.session_state["generated_tables"].items()))
             st.download_button(
                 label="📄 Download CSV",
                 data=csv_data,
@@ -767,7 +888,7 @@ if "generated_tables" in st.session_state and st.session_state["generated_tables
     with col2:
         # Direct ZIP Download
         try:
-            zip_data = export_manager.create_zip_export(st.session_state["generated_tables"])
+            zip_data = get_export_manager().create_zip_export(st.session_state["generated_tables"])
             st.download_button(
                 label="📦 Download ZIP",
                 data=zip_data,
@@ -1,19 +1,19 @@
 # config/settings.py
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
 from typing import Optional
+from urllib.parse import quote_plus
 
-# Load environment variables from .env file
-# Try multiple paths to find the .env file
-env_paths = ['.env', '../.env', '../../.env']
-for env_path in env_paths:
-    if os.path.exists(env_path):
-        load_dotenv(env_path)
-        break
-else:
-    # If no .env file found, try loading from current directory
-    load_dotenv()
+def _find_env_file() -> Optional[str]:
+    """Return the first .env file found in the current or parent directories"""
+    return next((path for path in ('.env', '../.env', '../../.env') if os.path.isfile(path)), None)
 
+# Load environment variables from .env file once (existing environment variables win)
+# If no .env file is found, python-dotenv searches from the current directory
+load_dotenv(_find_env_file(), override=False)
+
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings and configuration"""
     
@@ -35,8 +35,15 @@ class Settings:
     DB_USER: str = os.getenv("DB_USER", "postgres")
     DB_PASSWORD: str = os.getenv("DB_PASSWORD", "password")
     
-    # Construct DATABASE_URL from individual components
-    DATABASE_URL: str = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    # Construct DATABASE_URL from individual components (credentials are URL-quoted)
+    DATABASE_URL: str = f"postgresql://{quote_plus(DB_USER)}:{quote_plus(DB_PASSWORD)}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    
+    # Connection pool tuning
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # Seconds before a pooled connection is replaced
+    # Load with COPY FROM STDIN; set to false where COPY is not available (paged multi-row INSERTs are used instead)
+    DB_USE_COPY: bool = os.getenv("DB_USE_COPY", "true").lower() == "true"
     
     # Langfuse Configuration
     LANGFUSE_PUBLIC_KEY: Optional[str] = os.getenv("LANGFUSE_PUBLIC_KEY")
@@ -54,12 +61,17 @@ class Settings:
     MAX_RECORDS_PER_TABLE: int = int(os.getenv("MAX_RECORDS_PER_TABLE", "10000"))
     FAST_MODE_RECORDS: int = int(os.getenv("FAST_MODE_RECORDS", "20"))  # For quick testing
     DEFAULT_INSTRUCTIONS: str = os.getenv("DEFAULT_INSTRUCTIONS", "Generate realistic, diverse data that follows common patterns and constraints")
+    AI_CACHE_DIR: str = os.getenv("AI_CACHE_DIR", ".ai_cache")
+    TABLE_CACHE_DIR: str = os.getenv("TABLE_CACHE_DIR", ".cache/tables")
     
     # AI Model Configuration
     GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
     MAX_OUTPUT_TOKENS: int = int(os.getenv("MAX_OUTPUT_TOKENS", "65535"))
     MAX_DATA_GENERATION_TOKENS: int = int(os.getenv("MAX_DATA_GENERATION_TOKENS", "65535"))
     MAX_QUERY_GENERATION_TOKENS: int = int(os.getenv("MAX_QUERY_GENERATION_TOKENS", "1000"))
+    AI_MAX_CONCURRENCY: int = int(os.getenv("AI_MAX_CONCURRENCY", "8"))  # Parallel requests when generating several tables
+    AI_REQUESTS_PER_MINUTE: int = int(os.getenv("AI_REQUESTS_PER_MINUTE", "60"))
+    AI_TOKENS_PER_MINUTE: int = int(os.getenv("AI_TOKENS_PER_MINUTE", "1000000"))
     DEFAULT_QUERY_TEMPERATURE: float = float(os.getenv("DEFAULT_QUERY_TEMPERATURE", "0.1"))
 
 # Global settings instance
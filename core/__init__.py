@@ -5,7 +5,6 @@ from .guardrails import GuardrailsManager
 from .observability import ObservabilityManager
 from .ddl_parser import DDLParser
 from .synthetic_data_engine import SyntheticDataEngine
-from .database_manager import DatabaseManager
 from .ai_client import AIClient
 from .auth_manager import AuthManager
 
@@ -21,3 +20,10 @@ __all__ = [
     "AuthManager"
 ]
 
+
+def __getattr__(name):
+    # DatabaseManager pulls in SQLAlchemy, so it is only imported on first use
+    if name == "DatabaseManager":
+        from .database_manager import DatabaseManager
+        return DatabaseManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,45 +4,115 @@ AI client - no overengineering.
 This module provides a straightforward interface to Gemini AI.
 """
 
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
 import streamlit as st
-from typing import Optional
+from typing import List, Optional
+from google.genai import types
 from langfuse import observe, get_client
+from config.settings import settings
+from core.auth_manager import auth_manager
 from core.observability import observability
 
+# Characters of prompt/response text attached to Langfuse generations
+TRACE_PREVIEW_CHARS = 500
+
+def _trace_preview(text: str) -> str:
+    """Return text unchanged if short, otherwise its first TRACE_PREVIEW_CHARS characters with an ellipsis"""
+    return text if len(text) <= TRACE_PREVIEW_CHARS else f"{text[:TRACE_PREVIEW_CHARS]}..."
+
+def estimate_tokens(prompt: str) -> int:
+    """Rough prompt token count (about four characters per token)"""
+    return max(1, len(prompt) // 4)
+
+
+class RequestThrottle:
+    """Sliding one-minute window over requests and prompt tokens.
+    
+    Callers wait before sending instead of hitting 429 responses. The token
+    budget keeps a safety margin below the configured tokens-per-minute limit.
+    """
+    
+    WINDOW_SECONDS = 60.0
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, headroom: float = 0.1):
+        self.requests_per_minute = requests_per_minute
+        self.token_budget = int(tokens_per_minute * (1 - headroom))
+        # (timestamp, tokens) of requests sent within the window
+        self._sent = deque()
+        self._tokens_in_window = 0
+        # Shared by all sessions, which run on separate threads
+        self._lock = threading.Lock()
+    
+    def _reserve(self, tokens: int) -> float:
+        """Record a request if it fits the window, otherwise return seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            while self._sent and now - self._sent[0][0] >= self.WINDOW_SECONDS:
+                self._tokens_in_window -= self._sent.popleft()[1]
+            
+            # An empty window always admits the request, even if it alone exceeds the budget
+            if not self._sent or (len(self._sent) < self.requests_per_minute
+                                  and self._tokens_in_window + tokens <= self.token_budget):
+                self._sent.append((now, tokens))
+                self._tokens_in_window += tokens
+                return 0.0
+            return self.WINDOW_SECONDS - (now - self._sent[0][0])
+    
+    async def acquire(self, tokens: int) -> None:
+        """Wait without blocking the event loop until the request fits the window"""
+        while (delay := self._reserve(tokens)) > 0:
+            await asyncio.sleep(delay)
+    
+    def acquire_blocking(self, tokens: int) -> None:
+        """Wait until the request fits the window"""
+        while (delay := self._reserve(tokens)) > 0:
+            time.sleep(delay)
+
+
+# Rate limits apply per API project, so all clients share one throttle
+request_throttle = RequestThrottle(settings.AI_REQUESTS_PER_MINUTE, settings.AI_TOKENS_PER_MINUTE)
+
 
 class AIClient:
     """AI client - just makes API calls."""
     
-    def __init__(self):
+    def __init__(self, trace: bool = True):
         # Enable debug logging by default for troubleshooting
         self.debug_mode = True
+        # Langfuse client for enhanced tracing, resolved once per AI client (None disables generation updates)
+        self._langfuse = get_client() if trace else None
     
     @observe(as_type="generation", name="gemini_content_generation")
     def generate_content(self, prompt: str, temperature: float = 0.4, 
                         max_tokens: int = None) -> Optional[str]:
         """Generate content using Gemini AI."""
+        langfuse = self._langfuse
         try:
-            # Get Langfuse client for enhanced tracing
-            langfuse = get_client()
-            
             # Update observation with model info
-            from config.settings import settings
             model_name = settings.GEMINI_MODEL
             
+            # Use settings default if max_tokens not provided
+            if max_tokens is None:
+                max_tokens = settings.MAX_OUTPUT_TOKENS
+            
             # Update current generation with comprehensive metadata
             if langfuse:
                 langfuse.update_current_generation(
                     model=model_name,
                     model_parameters={
                         "temperature": temperature,
-                        "max_tokens": max_tokens or settings.MAX_OUTPUT_TOKENS
+                        "max_tokens": max_tokens
                     },
-                    input=prompt[:500] + "..." if len(prompt) > 500 else prompt,
+                    input=_trace_preview(prompt),
                     metadata={
                         "prompt_length": len(prompt),
                         "model": model_name,
                         "temperature": temperature,
-                        "max_tokens": max_tokens or settings.MAX_OUTPUT_TOKENS
+                        "max_tokens": max_tokens
                     }
                 )
             
@@ -56,14 +126,10 @@ class AIClient:
                 )
                 return None
             
-            # Use settings default if max_tokens not provided
-            if max_tokens is None:
-                max_tokens = settings.MAX_OUTPUT_TOKENS
-            
-            # Make API call
-            from google.genai import types
+            # Make API call once it fits the rate limits
+            request_throttle.acquire_blocking(estimate_tokens(prompt))
             response = client.models.generate_content(
-                model=settings.GEMINI_MODEL,
+                model=model_name,
                 contents=prompt,
                 config=types.GenerateContentConfig(
                     temperature=temperature,
@@ -71,23 +137,24 @@ class AIClient:
                 )
             )
             
-            if response and hasattr(response, 'text'):
-                response_text = response.text
-                
+            try:
+                response_text = response.text if response else None
+            except AttributeError:
+                response_text = None
+            
+            if response_text is not None:
                 # Extract token usage if available
-                usage_details = {}
-                if hasattr(response, 'usage_metadata'):
-                    usage_metadata = response.usage_metadata
-                    usage_details = {
-                        "input_tokens": getattr(usage_metadata, 'prompt_token_count', 0),
-                        "output_tokens": getattr(usage_metadata, 'candidates_token_count', 0),
-                        "total_tokens": getattr(usage_metadata, 'total_token_count', 0)
-                    }
+                usage_metadata = getattr(response, 'usage_metadata', None)
+                usage_details = {
+                    "input_tokens": usage_metadata.prompt_token_count,
+                    "output_tokens": usage_metadata.candidates_token_count,
+                    "total_tokens": usage_metadata.total_token_count
+                } if usage_metadata else {}
                 
                 # Update generation with response and usage details
                 if langfuse:
                     langfuse.update_current_generation(
-                        output=response_text[:500] + "..." if len(response_text) > 500 else response_text,
+                        output=_trace_preview(response_text),
                         usage_details=usage_details if usage_details else None,
                         metadata={
                             "response_length": len(response_text),
@@ -97,16 +164,12 @@ class AIClient:
                     )
                 
                 # Log the raw response for debugging if debug mode is enabled
-                if self.debug_mode:
-                    observability.log_info("=" * 80)
-                    observability.log_info("RAW AI RESPONSE - generate_content")
-                    observability.log_info("=" * 80)
-                    observability.log_info(f"Response length: {len(response_text)} characters")
-                    observability.log_info("-" * 80)
-                    observability.log_info(f"Response text: {repr(response_text)}")
-                    observability.log_info("-" * 80)
-                    observability.log_info("RAW AI RESPONSE END")
-                    observability.log_info("=" * 80)
+                # (one record, built only when INFO logging is enabled)
+                if self.debug_mode and observability.logger.isEnabledFor(logging.INFO):
+                    observability.log_info(
+                        f"RAW AI RESPONSE - generate_content ({len(response_text)} characters)\n"
+                        f"Response text: {repr(response_text)}"
+                    )
                 return response_text
             else:
                 st.error("❌ Invalid response from AI")
@@ -119,6 +182,9 @@ class AIClient:
                 return None
                 
         except Exception as e:
+            # Rejected credentials: force re-authentication on the next call
+            if getattr(e, 'code', None) in (401, 403):
+                auth_manager.invalidate_cached_client()
             st.error(f"❌ AI generation failed: {str(e)}")
             if langfuse:
                 langfuse.update_current_generation(
@@ -129,12 +195,59 @@ class AIClient:
             observability.log_exception(e, "ai_client_generate_content")
             return None
     
+    def generate_batch(self, prompts: List[str], temperature: float = 0.4,
+                       max_tokens: int = None, max_concurrency: int = 8) -> List[Optional[str]]:
+        """Generate content for several independent prompts concurrently (results keep prompt order)."""
+        # Resolve the client here: authentication reads Streamlit session state
+        client = self._get_gemini_client()
+        if not client:
+            st.error("❌ No Gemini client available")
+            return [None] * len(prompts)
+        
+        async def run_all() -> List[Optional[str]]:
+            # Bound in-flight requests to respect API rate limits
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def run_one(prompt: str) -> Optional[str]:
+                async with semaphore:
+                    return await self.generate_content_async(client, prompt, temperature, max_tokens)
+            
+            return await asyncio.gather(*(run_one(prompt) for prompt in prompts))
+        
+        return asyncio.run(run_all())
+    
+    @observe(as_type="generation", name="gemini_content_generation_async")
+    async def generate_content_async(self, client, prompt: str, temperature: float = 0.4,
+                                     max_tokens: int = None) -> Optional[str]:
+        """Generate content using the async Gemini interface of an authenticated client."""
+        if max_tokens is None:
+            max_tokens = settings.MAX_OUTPUT_TOKENS
+        
+        try:
+            await request_throttle.acquire(estimate_tokens(prompt))
+            response = await client.aio.models.generate_content(
+                model=settings.GEMINI_MODEL,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    temperature=temperature,
+                    max_output_tokens=max_tokens
+                )
+            )
+            response_text = response.text
+            if response_text is None:
+                observability.log_warning("Invalid response from AI (no text)")
+            return response_text
+            
+        except Exception as e:
+            if getattr(e, 'code', None) in (401, 403):
+                auth_manager.invalidate_cached_client()
+            observability.log_exception(e, "ai_client_generate_content_async")
+            return None
+    
     
     def _get_gemini_client(self):
         """Get Gemini client from authentication manager."""
         try:
-            from core.auth_manager import auth_manager
-            
             # Check if we have a valid authenticated client
             auth_status = auth_manager.get_authentication_status()
             
@@ -6,8 +6,9 @@ to eliminate duplications and improve maintainability.
 """
 
 import logging
+import time
 import streamlit as st
-from typing import Optional, Dict, Any
+from typing import Optional, Any, Mapping
 from google import genai
 from .auth_strategies import (
     AuthenticationStrategyFactory, 
@@ -19,14 +20,20 @@ from .auth_ui import AuthenticationUI
 
 logger = logging.getLogger(__name__)
 
+# Seconds an environment-configured client is reused before re-authenticating
+CLIENT_CACHE_TTL = 300
+
 class AuthManager:
     """Authentication manager for Gemini AI using Strategy pattern"""
     
     def __init__(self):
         self.ui = AuthenticationUI()
         self.strategies = AuthenticationStrategyFactory.get_strategies()
+        # Client built from environment credentials, shared across reruns and sessions
+        self._cached_client: Optional[genai.Client] = None
+        self._cached_at: float = 0.0
     
-    def get_authentication_status(self) -> Dict[str, Any]:
+    def get_authentication_status(self) -> Mapping[str, Any]:
         """Get current authentication status"""
         return self.ui.get_auth_status()
     
@@ -43,6 +50,11 @@ class AuthManager:
             
             strategy = strategies[0]  # Only one strategy at a time
             
+            # Reuse the recently authenticated client instead of re-resolving the strategy
+            if self._cached_client is not None and time.monotonic() - self._cached_at < CLIENT_CACHE_TTL:
+                self.ui.update_auth_status(True, self._cached_client, strategy.get_method_name())
+                return self._cached_client
+            
             if not strategy.is_available():
                 logger.error(f"Authentication strategy {strategy.get_method_name()} is not available")
                 self.ui.update_auth_status(False, None, None)
@@ -50,6 +62,9 @@ class AuthManager:
             
             # Try authentication with the single strategy
             client = self._authenticate_with_strategy(strategy)
+            if client:
+                self._cached_client = client
+                self._cached_at = time.monotonic()
             return client
             
         except AuthenticationError as e:
@@ -82,6 +97,12 @@ class AuthManager:
             raise
     
     
+    def invalidate_cached_client(self) -> None:
+        """Drop the cached client and mark the session as unauthenticated (e.g. after a 401/403)"""
+        self._cached_client = None
+        self._cached_at = 0.0
+        self.ui.update_auth_status(False, None, None)
+    
     def validate_current_auth(self) -> bool:
         """Validate if current authentication is still valid"""
         auth_status = self.ui.get_auth_status()
@@ -5,10 +5,12 @@ This module implements the Strategy pattern for authentication,
 allowing easy extension and testing of different auth methods.
 """
 
+import functools
 import logging
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any
 from google import genai
+from google.auth import default
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -21,6 +23,11 @@ class AuthenticationError(Exception):
         self.method = method
         self.original_error = original_error
         super().__init__(message)
+    
+    def __str__(self) -> str:
+        # The original error is only stringified when the message is actually rendered
+        message = super().__str__()
+        return f"{message}: {self.original_error}" if self.original_error else message
 
 
 class AuthenticationStrategy(ABC):
@@ -57,25 +64,31 @@ class VertexAIAuthStrategy(AuthenticationStrategy):
             logger.info("Vertex AI authentication successful")
             return client
         except Exception as e:
-            logger.error(f"Vertex AI authentication failed: {str(e)}")
-            raise AuthenticationError(
-                f"Vertex AI authentication failed: {str(e)}",
-                "vertex_ai_adc",
-                e
-            )
+            logger.error("%s authentication failed", self.get_method_name(), exc_info=True)
+            raise AuthenticationError("Vertex AI authentication failed", self.get_method_name(), e) from e
     
     def get_method_name(self) -> str:
         return "vertex_ai_adc"
     
     def is_available(self) -> bool:
         """Check if Vertex AI authentication is available"""
+        return self._is_available_cached()
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _is_available_cached(cls) -> bool:
+        """Resolve Application Default Credentials once per process"""
         try:
-            from google.auth import default
             credentials, project = default()
             return credentials is not None and project is not None
         except Exception as e:
-            logger.debug(f"Vertex AI not available: {str(e)}")
+            logger.debug("Vertex AI not available: %s", e)
             return False
+    
+    @classmethod
+    def invalidate(cls) -> None:
+        """Forget the cached availability check (e.g. after credentials change)"""
+        cls._is_available_cached.cache_clear()
 
 
 class APIKeyAuthStrategy(AuthenticationStrategy):
@@ -96,12 +109,8 @@ class APIKeyAuthStrategy(AuthenticationStrategy):
             logger.info("API key authentication successful")
             return client
         except Exception as e:
-            logger.error(f"API key authentication failed: {str(e)}")
-            raise AuthenticationError(
-                f"Invalid API key: {str(e)}",
-                "api_key",
-                e
-            )
+            logger.error("%s authentication failed", self.get_method_name(), exc_info=True)
+            raise AuthenticationError("Invalid API key", self.get_method_name(), e) from e
     
     def get_method_name(self) -> str:
         return "api_key"
@@ -121,20 +130,13 @@ class EnvironmentAPIKeyAuthStrategy(AuthenticationStrategy):
         
         try:
             logger.info("Attempting environment API key authentication...")
+            # The key is validated by the first real request; a rejected key invalidates the cached client
             client = genai.Client(api_key=settings.GEMINI_API_KEY)
-            
-            # Validate the API key by making a test call
-            logger.info("Validating API key with test call...")
-            test_response = client.models.list()
             logger.info("Environment API key authentication successful")
             return client
         except Exception as e:
-            logger.error(f"Environment API key authentication failed: {str(e)}")
-            raise AuthenticationError(
-                f"Environment API key is invalid: {str(e)}",
-                "env_api_key",
-                e
-            )
+            logger.error("%s authentication failed", self.get_method_name(), exc_info=True)
+            raise AuthenticationError("Environment API key is invalid", self.get_method_name(), e) from e
     
     def get_method_name(self) -> str:
         return "env_api_key"
@@ -148,6 +150,7 @@ class AuthenticationStrategyFactory:
     """Factory for creating authentication strategies"""
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_strategies() -> list[AuthenticationStrategy]:
         """Get authentication strategies based on environment configuration"""
         if settings.GEMINI_API_KEY:
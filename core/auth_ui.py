@@ -7,11 +7,20 @@ separated from business logic for better maintainability.
 
 import logging
 import streamlit as st
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Any, Mapping
 from .auth_strategies import AuthenticationError
 
 logger = logging.getLogger(__name__)
 
+# Error icon per authentication method
+_ERROR_ICONS = MappingProxyType({
+    "vertex_ai_adc": "🔧",
+    "api_key": "🔑",
+    "env_api_key": "⚙️"
+})
+_UNDERSCORE_TRANS = str.maketrans('_', ' ')
+
 
 class AuthenticationUI:
     """Handles authentication UI components and interactions"""
@@ -28,7 +37,7 @@ class AuthenticationUI:
                 'method': None
             }
     
-    def display_authentication_status(self, auth_status: Dict[str, Any]) -> None:
+    def display_authentication_status(self, auth_status: Mapping[str, Any]) -> None:
         """Display current authentication status"""
         if auth_status["authenticated"]:
             method_display = self._format_method_name(auth_status['method'])
@@ -79,16 +88,11 @@ class AuthenticationUI:
         """Format authentication method name for display"""
         if not method:
             return "Unknown"
-        return method.replace('_', ' ').title()
+        return method.translate(_UNDERSCORE_TRANS).title()
     
     def _get_error_icon(self, method: str) -> str:
         """Get appropriate error icon based on authentication method"""
-        icon_map = {
-            "vertex_ai_adc": "🔧",
-            "api_key": "🔑",
-            "env_api_key": "⚙️"
-        }
-        return icon_map.get(method, "❌")
+        return _ERROR_ICONS.get(method, "❌")
     
     def update_auth_status(self, authenticated: bool, client: Optional[Any], method: Optional[str]) -> None:
         """Update authentication status in session state"""
@@ -99,19 +103,20 @@ class AuthenticationUI:
             'method': method
         })
     
-    def get_auth_status(self) -> Dict[str, Any]:
-        """Get current authentication status"""
+    def get_auth_status(self) -> Mapping[str, Any]:
+        """Get current authentication status (read-only view, no copy)"""
         self._initialize_session_state()
-        return st.session_state.auth_status.copy()
+        return MappingProxyType(st.session_state.auth_status)
     
     def is_authenticated(self) -> bool:
         """Check if user is currently authenticated"""
-        auth_status = self.get_auth_status()
-        return auth_status.get('authenticated', False)
+        self._initialize_session_state()
+        return st.session_state.auth_status.get('authenticated', False)
     
     def get_authenticated_client(self) -> Optional[Any]:
         """Get the authenticated client if available"""
-        auth_status = self.get_auth_status()
+        self._initialize_session_state()
+        auth_status = st.session_state.auth_status
         if auth_status.get('authenticated', False):
             return auth_status.get('client')
         return None
@@ -9,19 +9,128 @@ This module orchestrates the entire data generation workflow:
 """
 
 import streamlit as st
+import functools
+import hashlib
 import logging
+import threading
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import pandas as pd
 from langfuse import observe
 
 from core.ddl_parser import DDLParser, Table
 from core.synthetic_data_engine import SyntheticDataEngine
-from core.database_manager import DatabaseManager
 from core.observability import observability
+from config.settings import settings
+from utils.dataframe_utils import apply_schema_dtypes
+
+if TYPE_CHECKING:
+    from core.database_manager import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+def ddl_hash(ddl_content: str) -> str:
+    """Content hash used to key DDL-derived caches"""
+    return hashlib.blake2b(ddl_content.encode('utf-8')).hexdigest()
+
+@functools.lru_cache(maxsize=32)
+def _parse_ddl_cached(ddl_digest: str, ddl_content: str) -> Tuple[Table, ...]:
+    """Parse DDL once per content hash (tuple so cached results are not mutated by callers)"""
+    return tuple(DDLParser().parse_ddl(ddl_content))
+
+def parse_ddl_cached(ddl_content: str) -> Tuple[Table, ...]:
+    """Parsed tables for DDL content, shared by every caller that needs them"""
+    return _parse_ddl_cached(ddl_hash(ddl_content), ddl_content)
+
+@st.cache_resource(show_spinner=False)
+def _get_db_manager(database_url: str) -> "DatabaseManager":
+    """Get a database manager (and its connection pool) shared across reruns and pages for a URL"""
+    # Imported here so SQLAlchemy is only loaded when the database is actually used
+    from core.database_manager import DatabaseManager
+    db_manager = DatabaseManager(database_url)
+    db_manager.set_error_reporter(st.error)
+    return db_manager
+
+def get_database_manager(database_url: Optional[str] = None) -> "DatabaseManager":
+    """Shared database manager; the single cached factory used by every page and workflow"""
+    return _get_db_manager(database_url or settings.DATABASE_URL)
+
+class _UncacheableGeneration(Exception):
+    """Carries generated data that must not be cached (e.g. it contains fallback tables)"""
+    
+    def __init__(self, generated_data: Dict[str, pd.DataFrame]):
+        super().__init__("generated data contains fallback tables")
+        self.generated_data = generated_data
+
+@st.cache_data(show_spinner=False, max_entries=16, ttl=3600)
+def _cached_generate(ddl_digest: str, _tables: Tuple[Table, ...], instructions: str,
+                     temperature: float, num_records: int) -> Dict[str, pd.DataFrame]:
+    """Generate data for parsed DDL, cached on the DDL hash and generation parameters"""
+    data_engine = SyntheticDataEngine()
+    generated_data = data_engine.generate_data(
+        tables=list(_tables),
+        generation_prompt=instructions,
+        temperature=temperature,
+        rows_per_table=num_records
+    )
+    # Exceptions are not cached: placeholder data from failed AI calls must not be replayed
+    if data_engine.used_fallback:
+        raise _UncacheableGeneration(generated_data)
+    return generated_data
+
+class _GenerationInterrupted(Exception):
+    """The session running a shared generation stopped before it finished (e.g. a Streamlit rerun)"""
+
+# Generations currently running, keyed on their parameters, so racing reruns share one result
+_in_flight: Dict[Tuple, Future] = {}
+_in_flight_lock = threading.Lock()
+
+def _generate_once(ddl_digest: str, tables: Tuple[Table, ...], instructions: str,
+                   temperature: float, num_records: int) -> Dict[str, pd.DataFrame]:
+    """Generate data, waiting on an identical in-flight generation instead of starting another"""
+    key = (ddl_digest, instructions, temperature, num_records)
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _in_flight[key] = future
+    
+    if not is_owner:
+        try:
+            return future.result()
+        except _GenerationInterrupted:
+            # The owner was interrupted; run the generation here instead
+            return _generate_once(ddl_digest, tables, instructions, temperature, num_records)
+    
+    try:
+        try:
+            generated_data = _cached_generate(ddl_digest, tables, instructions, temperature, num_records)
+        except _UncacheableGeneration as uncached:
+            generated_data = uncached.generated_data
+        future.set_result(generated_data)
+        return generated_data
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _in_flight_lock:
+            _in_flight.pop(key, None)
+        # Streamlit's RerunException/StopException derive from BaseException; waiters must not block forever
+        if not future.done():
+            future.set_exception(_GenerationInterrupted())
+
+@contextmanager
+def _phase(phase_times: Dict[str, float], name: str):
+    """Record the wall time of a workflow phase in seconds"""
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        phase_times[name] = (time.perf_counter_ns() - start) / 1e9
+
 class DataGenerationOrchestrator:
     """Orchestrates the complete data generation workflow from DDL to database storage"""
     
@@ -48,6 +157,10 @@ class DataGenerationOrchestrator:
             Dictionary mapping table names to DataFrames
         """
         start_time = time.time()
+        # Per-phase wall times, to tell AI latency apart from DataFrame and database work
+        phase_times: Dict[str, float] = {}
+        # One collapsible status block instead of a separate message per step
+        status = st.status("⚙️ Generating data...", expanded=False)
         
         try:
             # Log workflow start
@@ -68,7 +181,8 @@ class DataGenerationOrchestrator:
                 "start"
             )
             
-            tables = self.ddl_parser.parse_ddl(ddl_content)
+            with _phase(phase_times, "parse"):
+                tables = list(parse_ddl_cached(ddl_content))
             
             if not tables:
                 observability.log_workflow_step(
@@ -77,7 +191,7 @@ class DataGenerationOrchestrator:
                     "error",
                     reason="no_tables_found"
                 )
-                st.error("❌ No tables found in DDL")
+                status.update(label="❌ No tables found in DDL", state="error", expanded=True)
                 return {}
             
             observability.log_workflow_step(
@@ -86,7 +200,7 @@ class DataGenerationOrchestrator:
                 "success",
                 tables_parsed=len(tables)
             )
-            st.success(f"✅ Parsed {len(tables)} tables from DDL")
+            status.write(f"✅ Parsed {len(tables)} tables from DDL")
             
             # Generate synthetic data
             observability.log_workflow_step(
@@ -97,12 +211,11 @@ class DataGenerationOrchestrator:
                 rows_per_table=num_records
             )
             
-            generated_data = self.data_engine.generate_data(
-                tables=tables,
-                generation_prompt=instructions or "",
-                temperature=temperature,
-                rows_per_table=num_records
-            )
+            # Identical DDL + parameters reuse the previous (or in-flight) result instead of calling the AI again
+            with _phase(phase_times, "generate"):
+                generated_data = _generate_once(
+                    ddl_hash(ddl_content), tuple(tables), instructions or "", temperature, num_records
+                )
             
             if not generated_data:
                 observability.log_workflow_step(
@@ -111,16 +224,24 @@ class DataGenerationOrchestrator:
                     "error",
                     reason="no_data_generated"
                 )
-                st.error("❌ Failed to generate any data")
+                status.update(label="❌ Failed to generate any data", state="error", expanded=True)
                 return {}
             
+            # Narrow dtypes using the DDL column types before storing or caching the tables
+            with _phase(phase_times, "dtypes"):
+                tables_by_name = {table.name: table for table in tables}
+                generated_data = {
+                    name: apply_schema_dtypes(df, tables_by_name[name]) if name in tables_by_name else df
+                    for name, df in generated_data.items()
+                }
+            
             observability.log_workflow_step(
                 "data_generation_workflow",
                 "synthetic_data_generation",
                 "success",
                 tables_generated=len(generated_data)
             )
-            st.success(f"✅ Generated data for {len(generated_data)} tables")
+            status.write(f"✅ Generated data for {len(generated_data)} tables")
             
             # Store in database if URL provided
             if database_url:
@@ -129,8 +250,9 @@ class DataGenerationOrchestrator:
                     "database_storage",
                     "start"
                 )
-                st.info("💾 Storing data in database...")
-                self._store_data_in_database(ddl_content, generated_data, database_url)
+                status.write("💾 Storing data in database...")
+                with _phase(phase_times, "storage"):
+                    self._store_data_in_database(ddl_content, tables, generated_data, database_url, status)
                 observability.log_workflow_step(
                     "data_generation_workflow",
                     "database_storage",
@@ -151,9 +273,12 @@ class DataGenerationOrchestrator:
                 "complete_data_generation_workflow",
                 total_duration,
                 tables=len(generated_data),
-                records_per_table=num_records
+                records_per_table=num_records,
+                **{f"{name}_s": round(seconds, 3) for name, seconds in phase_times.items()}
             )
             
+            status.update(label=f"✅ Generated data for {len(generated_data)} tables", state="complete")
+            observability.flush()
             return generated_data
             
         except Exception as e:
@@ -166,50 +291,62 @@ class DataGenerationOrchestrator:
                 duration=total_duration
             )
             observability.log_exception(e, "data_generation_workflow")
-            st.error(f"❌ Error in data generation: {str(e)}")
+            observability.flush()
+            status.update(label=f"❌ Error in data generation: {str(e)}", state="error", expanded=True)
             logger.error(f"Error in data generation: {e}")
             return {}
     
-    def _store_data_in_database(self, ddl_content: str, generated_data: Dict[str, pd.DataFrame], 
-                               database_url: str):
-        """Store generated data in database"""
+    def _store_data_in_database(self, ddl_content: str, tables: List[Table],
+                               generated_data: Dict[str, pd.DataFrame], database_url: str, status=None):
+        """Store generated data in database, reporting progress into the workflow status block"""
+        status = status or st.container()
         try:
-            # Initialize database manager
-            self.db_manager = DatabaseManager(database_url)
+            # Reuse the pooled database manager for this URL
+            self.db_manager = get_database_manager(database_url)
             
             # Execute DDL to create tables
-            st.info("🏗️ Creating database tables...")
+            status.write("🏗️ Creating database tables...")
             ddl_success = self.db_manager.execute_ddl(ddl_content)
             
             if not ddl_success:
-                st.error("❌ Failed to create database tables")
+                status.error("❌ Failed to create database tables")
                 return
             
-            st.success("✅ Database tables created successfully")
+            status.write("✅ Database tables created successfully")
+            
+            # Determine insertion order based on foreign key dependencies (reusing the parsed DDL, cached per DDL)
+            dependencies, insertion_order = self.db_manager._get_insertion_plan(
+                generated_data, ddl_content, tables=tables
+            )
+            
+            # Insert data (independent tables in parallel)
+            status.write("📥 Inserting data into database...")
+            progress = status.progress(0.0)
+            done_tables = []
             
-            # Determine insertion order based on foreign key dependencies
-            insertion_order = self.db_manager._get_insertion_order(generated_data, ddl_content)
+            def report_progress(table_name: str, success: bool):
+                # Called on this thread as each worker finishes a table
+                done_tables.append(table_name)
+                progress.progress(len(done_tables) / len(generated_data), text=f"{'✅' if success else '❌'} {table_name}")
             
-            # Insert data
-            st.info("📥 Inserting data into database...")
-            results = self.db_manager.insert_dataframes(generated_data, insertion_order)
+            results = self.db_manager.insert_dataframes(
+                generated_data, insertion_order, dependencies=dependencies, on_progress=report_progress
+            )
             
             # Report results
-            successful_tables = [table for table, success in results.items() if success]
-            failed_tables = [table for table, success in results.items() if not success]
+            successful_tables, failed_tables = [], []
+            for table, success in results.items():
+                (successful_tables if success else failed_tables).append(table)
             
             if successful_tables:
-                st.success(f"✅ Successfully inserted data for {len(successful_tables)} tables: {', '.join(successful_tables)}")
+                status.write(f"✅ Successfully inserted data for {len(successful_tables)} tables: {', '.join(successful_tables)}")
             
             if failed_tables:
-                st.error(f"❌ Failed to insert data for {len(failed_tables)} tables: {', '.join(failed_tables)}")
+                status.error(f"❌ Failed to insert data for {len(failed_tables)} tables: {', '.join(failed_tables)}")
             
         except Exception as e:
-            st.error(f"❌ Error storing data in database: {str(e)}")
+            status.error(f"❌ Error storing data in database: {str(e)}")
             logger.error(f"Error storing data in database: {e}")
-        finally:
-            if self.db_manager:
-                self.db_manager.close()
     
     def get_table_preview(self, generated_data: Dict[str, pd.DataFrame], 
                          table_name: str, num_rows: int = 5) -> Optional[pd.DataFrame]:
@@ -5,43 +5,342 @@ This module provides a clean, focused approach to database operations
 without the complexity and over-engineering of the previous implementation.
 """
 
+import hashlib
 import logging
-from typing import Dict, List, Optional
+import random
+import re
+import string
+import struct
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from itertools import count
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import numpy as np
 import pandas as pd
-import streamlit as st
-from sqlalchemy import create_engine, text, MetaData, Table as SQLTable
+from sqlalchemy import create_engine, make_url, text, MetaData, Table as SQLTable
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
+from config.settings import settings
+from core.ddl_parser import DDLParser, Table
+from utils.dataframe_utils import expand_categories
 
 logger = logging.getLogger(__name__)
 
+# Insertion plans (dependencies and order) kept per DDL and set of generated tables
+INSERTION_PLAN_CACHE_SIZE = 32
+
+# Static statements are wrapped in text() once at import, not on every call
+
+# Column, key and unique constraint/index metadata of one table, tagged by kind
+TABLE_SCHEMA_QUERY = text("""
+SELECT 'column' AS kind, column_name, data_type, character_maximum_length, is_nullable, column_default,
+       NULL AS foreign_table_name, NULL AS foreign_column_name, ordinal_position AS position
+FROM information_schema.columns
+WHERE table_name = :table_name
+UNION ALL
+SELECT 'primary_key', kcu.column_name, NULL, NULL, NULL, NULL, NULL, NULL, kcu.ordinal_position
+FROM information_schema.table_constraints tc
+JOIN information_schema.key_column_usage kcu
+    ON tc.constraint_name = kcu.constraint_name
+WHERE tc.table_name = :table_name
+    AND tc.constraint_type = 'PRIMARY KEY'
+UNION ALL
+SELECT 'foreign_key', kcu.column_name, NULL, NULL, NULL, NULL, ccu.table_name, ccu.column_name, kcu.ordinal_position
+FROM information_schema.table_constraints tc
+JOIN information_schema.key_column_usage kcu
+    ON tc.constraint_name = kcu.constraint_name
+JOIN information_schema.constraint_column_usage ccu
+    ON ccu.constraint_name = tc.constraint_name
+WHERE tc.table_name = :table_name
+    AND tc.constraint_type = 'FOREIGN KEY'
+UNION ALL
+SELECT 'unique', kcu.column_name, NULL, NULL, NULL, NULL, NULL, NULL, kcu.ordinal_position
+FROM information_schema.table_constraints tc
+JOIN information_schema.key_column_usage kcu
+    ON tc.constraint_name = kcu.constraint_name
+WHERE tc.table_name = :table_name
+    AND tc.constraint_type = 'UNIQUE'
+UNION ALL
+SELECT 'unique_index', a.attname, NULL, NULL, NULL, NULL, NULL, NULL, a.attnum
+FROM pg_class t
+JOIN pg_index ix ON t.oid = ix.indrelid
+JOIN pg_class i ON i.oid = ix.indexrelid
+JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(ix.indkey)
+WHERE t.relname = :table_name
+    AND ix.indisunique = true
+    AND i.relname NOT LIKE '%_pkey'
+ORDER BY kind, position
+""")
+
+# Sequences feeding the column defaults of the given tables, plus any existing sequence
+# with one of the candidate names
+TABLE_SEQUENCES_QUERY = text("""
+SELECT s.sequence_name
+FROM information_schema.sequences s
+JOIN information_schema.columns c ON s.sequence_name LIKE '%' || c.table_name || '%'
+WHERE c.table_name = ANY(:table_names)
+AND c.column_default LIKE '%' || s.sequence_name || '%'
+UNION
+SELECT sequencename FROM pg_sequences WHERE sequencename = ANY(:candidates)
+""")
+
+# Existence and columns of one table, for schema verification
+TABLE_EXISTS_QUERY = text("SELECT 1 FROM information_schema.tables WHERE table_name = :table_name")
+TABLE_COLUMNS_QUERY = text("""
+SELECT column_name, data_type, is_nullable
+FROM information_schema.columns
+WHERE table_name = :table_name
+ORDER BY ordinal_position
+""")
+
+SELECT_ONE_QUERY = text("SELECT 1")
+
+# (error text marker, title, explanation, solution) shown for common insert failures
+INSERT_ERROR_HINTS = (
+    ("duplicate key value violates unique constraint", "Primary Key Conflict",
+     "The table already contains data with the same primary key values.",
+     "Try running the data generation again - the system will now properly drop and recreate tables."),
+    ("foreign key constraint", "Foreign Key Constraint Violation",
+     "The data references non-existent records in related tables.",
+     "Ensure all referenced tables are created and populated first."),
+    ("value too long for type", "Data Too Long for Column",
+     "Some data exceeds the maximum length allowed by the database schema.",
+     "The system will now validate data before insertion to prevent this."),
+    ("date/time field value out of range", "Invalid Date",
+     "Some dates are invalid (e.g., February 29th in non-leap years).",
+     "The system will now validate dates before insertion."),
+)
+
+# Validation stops formatting error messages once a table has this many
+MAX_VALIDATION_ERRORS = 100
+
+# Seconds a successful connectivity check is trusted before querying the server again
+CONNECTION_CHECK_TTL = 5.0
+
+# Rows per batch when bulk-inserting DataFrames
+INSERT_CHUNK_SIZE = 10_000
+
+# Rows per INSERT ... VALUES statement when PostgreSQL loads without COPY
+VALUES_INSERT_PAGE_SIZE = 1000
+
+# Bind parameters per multi-row INSERT statement (PostgreSQL allows at most 65535)
+MULTI_INSERT_PARAM_LIMIT = 32_000
+
+# psycopg2 fast execution helpers: executemany is folded into multi-row VALUES / execute_batch pages
+PSYCOPG2_EXECUTEMANY_OPTIONS = {
+    'executemany_mode': 'values_plus_batch',
+    'insertmanyvalues_page_size': 1000,
+    'executemany_batch_page_size': 500,
+}
+
+# Single-pass DDL tokenizer: quoted literals/identifiers are kept intact (including any ';' inside),
+# comments are dropped, whitespace runs collapse and ';' ends a statement
+DDL_TOKEN_PATTERN = re.compile(r"""
+    (?P<quoted>'(?:[^']|'')*'|"(?:[^"]|"")*")
+  | (?P<comment>--[^\n]*|/\*.*?\*/)
+  | (?P<space>\s+)
+  | (?P<end>;)
+  | (?P<text>[^'"\s;/-]+|.)
+""", re.DOTALL | re.VERBOSE)
+CREATE_TABLE_PATTERN = re.compile(r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)', re.IGNORECASE)
+
+# Table recording the hash of the last DDL applied, so unchanged schemas are not recreated
+SCHEMA_META_TABLE = "_schema_meta"
+SCHEMA_META_EXISTS_QUERY = text("SELECT to_regclass(:name)")
+STORED_SCHEMA_HASH_QUERY = text(f"SELECT ddl_hash FROM {SCHEMA_META_TABLE} WHERE id = 1")
+RECORD_SCHEMA_HASH_QUERY = text(f"""
+INSERT INTO {SCHEMA_META_TABLE} (id, ddl_hash) VALUES (1, :ddl_hash)
+ON CONFLICT (id) DO UPDATE SET ddl_hash = EXCLUDED.ddl_hash
+""")
+EXISTING_TABLES_COUNT_QUERY = text("""
+SELECT count(*) FROM information_schema.tables
+WHERE table_schema = current_schema() AND table_name = ANY(:names)
+""")
+
+# Bytes handed to the server per read while streaming COPY data
+COPY_READ_SIZE = 64 * 1024
+
+# NULL marker for COPY ... CSV (keeps empty strings distinct from NULL)
+COPY_NULL = r'\N'
+
+# Fixed-width PostgreSQL types sent as big-endian values in binary COPY
+BINARY_COPY_TYPES = {
+    'smallint': '>i2',
+    'integer': '>i4',
+    'bigint': '>i8',
+    'real': '>f4',
+    'double precision': '>f8',
+    'boolean': '?',
+}
+# Signature, flags and header extension length, then the end-of-data marker
+PGCOPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+PGCOPY_TRAILER = struct.pack('>h', -1)
+
+def _match_column_types(df: pd.DataFrame, column_types: Dict[str, str]) -> pd.DataFrame:
+    """Cast float columns holding whole numbers to integers where the destination column is an integer"""
+    matched = df
+    for col in df.columns:
+        wire_type = BINARY_COPY_TYPES.get(column_types.get(col), '')
+        series = df[col]
+        if not wire_type.startswith('>i') or not pd.api.types.is_float_dtype(series):
+            continue
+        values = series.dropna()
+        if not (values % 1 == 0).all():
+            continue
+        if matched is df:
+            matched = df.copy(deep=False)
+        # Nullable integers keep NULLs; both serialize without a trailing '.0'
+        matched[col] = series.astype('Int64' if len(values) < len(series) else 'int64')
+    return matched
+
+def _binary_copy_fields(df: pd.DataFrame, column_types: Dict[str, str]) -> Optional[List[tuple]]:
+    """Binary COPY row layout for a DataFrame, or None if any column needs the CSV path"""
+    fields = [('num_fields', '>i2')]
+    for i, col in enumerate(df.columns):
+        wire_type = BINARY_COPY_TYPES.get(column_types.get(col))
+        series = df[col]
+        # NULLs would make rows variable-width
+        if wire_type is None or series.isna().any():
+            return None
+        if wire_type == '?':
+            if not pd.api.types.is_bool_dtype(series):
+                return None
+        elif wire_type.startswith('>i'):
+            if not pd.api.types.is_integer_dtype(series) or pd.api.types.is_bool_dtype(series):
+                return None
+            # Out-of-range values must reach the server and fail there, not wrap around
+            limits = np.iinfo(np.dtype(wire_type))
+            if len(series) and (series.min() < limits.min or series.max() > limits.max):
+                return None
+        elif not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            return None
+        fields += [(f'len{i}', '>i4'), (f'val{i}', wire_type)]
+    return fields
+
+def _binary_copy_rows(df: pd.DataFrame, fields: List[tuple]) -> bytes:
+    """Encode rows as PostgreSQL binary COPY tuples with one structured NumPy array"""
+    rows = np.empty(len(df), dtype=fields)
+    rows['num_fields'] = len(df.columns)
+    for i, col in enumerate(df.columns):
+        value_dtype = rows.dtype[f'val{i}']
+        rows[f'len{i}'] = value_dtype.itemsize
+        rows[f'val{i}'] = df[col].to_numpy(dtype=value_dtype.newbyteorder('='))
+    return rows.tobytes()
+
+def _script_context_initializer() -> Optional[Callable[[], None]]:
+    """Thread initializer attaching the current Streamlit script context, if running under Streamlit.
+    
+    Lets worker threads report errors to the page without this module importing Streamlit.
+    """
+    if 'streamlit' not in sys.modules:
+        return None
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+    script_ctx = get_script_run_ctx()
+    return lambda: add_script_run_ctx(threading.current_thread(), script_ctx)
+
+class _ChunkStream:
+    """Read-only file object over an iterator of byte chunks.
+    
+    COPY pulls data through read(), so each chunk is only serialized when the
+    previous one has been sent and at most one chunk is held in memory.
+    """
+    
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._current = b''
+        self._pos = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        parts = []
+        while size != 0:
+            if self._pos >= len(self._current):
+                self._current = next(self._chunks, None)
+                self._pos = 0
+                if self._current is None:
+                    self._current = b''
+                    break
+            end = len(self._current) if size < 0 else self._pos + size
+            piece = self._current[self._pos:end]
+            self._pos += len(piece)
+            parts.append(piece)
+            if size > 0:
+                size -= len(piece)
+        return b''.join(parts)
+
 class DatabaseManager:
     """Database manager for PostgreSQL operations"""
     
-    def __init__(self, database_url: Optional[str] = None):
+    def __init__(self, database_url: Optional[str] = None, pool_size: Optional[int] = None,
+                 max_overflow: Optional[int] = None, pool_recycle: Optional[int] = None):
         """
         Initialize database manager
         
         Args:
             database_url: Database connection URL. If None, uses DATABASE_URL from environment
+            pool_size: Persistent pooled connections. If None, uses DB_POOL_SIZE
+            max_overflow: Extra connections allowed under load. If None, uses DB_MAX_OVERFLOW
+            pool_recycle: Seconds before a pooled connection is replaced. If None, uses DB_POOL_RECYCLE
         """
         if database_url is None:
-            from config.settings import Settings
-            self.database_url = Settings.DATABASE_URL
+            self.database_url = settings.DATABASE_URL
         else:
             self.database_url = database_url
             
+        self.pool_size = settings.DB_POOL_SIZE if pool_size is None else pool_size
+        self.max_overflow = settings.DB_MAX_OVERFLOW if max_overflow is None else max_overflow
+        self.pool_recycle = settings.DB_POOL_RECYCLE if pool_recycle is None else pool_recycle
+        
         self.engine = None
         self.SessionLocal = None
-        self.conn = None
+        # Monotonic time of the last successful round-trip (0 = unknown or failed)
+        self._last_ok_ts = 0.0
+        # Receives user-facing error messages (e.g. st.error); silent unless set by the UI
+        self._on_error: Callable[[str], None] = lambda message: None
+        # table name -> schema info from _get_table_schema, cleared whenever DDL is executed
+        self._schema_cache: Dict[str, Dict] = {}
+        # (DDL hash, table names) -> (dependencies, insertion order)
+        self._plan_cache: Dict[Tuple[str, frozenset], Tuple[Dict[str, List[str]], List[str]]] = {}
+        # Next 9-digit ISBN body handed out for duplicate ISBNs; next() on a count is thread-safe
+        self._isbn_counter = count(100_000_000)
         
         self._initialize_connection()
     
+    def set_error_reporter(self, reporter: Callable[[str], None]) -> None:
+        """Set the callback that shows user-facing error messages"""
+        self._on_error = reporter
+    
+    def _report_error(self, message: str) -> None:
+        """Show a user-facing error message through the configured reporter"""
+        try:
+            self._on_error(message)
+        except Exception as e:
+            logger.warning(f"Error reporter failed: {e}")
+    
     def _initialize_connection(self):
         """Initialize database connection using SQLAlchemy"""
         try:
             # Always use SQLAlchemy with DATABASE_URL from environment
-            self.engine = create_engine(self.database_url)
+            # Pooled engine; pre-ping replaces connections dropped while the manager is cached,
+            # LIFO checkout keeps reusing the warmest connections so idle ones can expire
+            # The executemany options are psycopg2-specific and rejected by other drivers
+            driver_options = (
+                PSYCOPG2_EXECUTEMANY_OPTIONS
+                if make_url(self.database_url).drivername in ('postgresql', 'postgresql+psycopg2')
+                else {}
+            )
+            self.engine = create_engine(
+                self.database_url,
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow,
+                pool_recycle=self.pool_recycle,
+                pool_pre_ping=True,
+                pool_use_lifo=True,
+                **driver_options
+            )
             self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
             self._test_connection()
             
@@ -55,7 +354,8 @@ class DatabaseManager:
         """Test SQLAlchemy connection"""
         try:
             with self.engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+                conn.execute(SELECT_ONE_QUERY)
+            self._last_ok_ts = time.monotonic()
         except Exception as e:
             logger.error(f"Database connection test failed: {e}")
             raise
@@ -75,11 +375,14 @@ class DatabaseManager:
         try:
             # Use SQLAlchemy connection
             return self._execute_ddl_sqlalchemy(ddl_content, drop_existing=drop_existing)
-                
+
         except Exception as e:
-            logger.error(f"DDL execution failed: {e}")
-            st.error(f"❌ Failed to create database tables: {str(e)}")
+            logger.exception("DDL execution failed")
+            self._report_error(f"❌ Failed to create database tables: {str(e)}")
             return False
+        finally:
+            # Tables may have been recreated with a different structure
+            self._schema_cache.clear()
     
     def create_tables_from_ddl(self, ddl_content: str, drop_existing: bool = True) -> bool:
         """
@@ -94,26 +397,47 @@ class DatabaseManager:
         """
         return self.execute_ddl(ddl_content, drop_existing=drop_existing)
     
-    def store_generated_data(self, generated_data: Dict[str, pd.DataFrame], ddl_content: str = None) -> Dict[str, bool]:
+    def store_generated_data(self, generated_data: Dict[str, pd.DataFrame], ddl_content: str = None,
+                             tables: Optional[List[Table]] = None, fast_bulk: bool = True,
+                             on_progress: Optional[Callable[[str, bool], None]] = None) -> Dict[str, bool]:
         """
         Store generated data in database tables
         
         Args:
             generated_data: Dictionary mapping table names to DataFrames
             ddl_content: Optional DDL content for dependency ordering
+            tables: Optional already-parsed DDL tables (avoids parsing ddl_content again)
+            fast_bulk: On PostgreSQL, load into UNLOGGED tables without synchronous commit.
+                A server crash during the load loses the tables' contents, which is
+                acceptable for regenerable synthetic data
+            on_progress: Optional callback invoked on the calling thread with (table name, success)
+                after each table is inserted, e.g. to advance a progress bar
             
         Returns:
             Dictionary mapping table names to success status
         """
         try:
-            # First, try to clear any existing data from the tables
-            self._clear_existing_data(list(generated_data.keys()))
-            
-            # Insertion order - tables without foreign keys first
-            insertion_order = self._get_insertion_order(generated_data, ddl_content)
-            
-            # Insert data
-            results = self.insert_dataframes(generated_data, insertion_order)
+            # One pooled connection for the whole operation (one checkout and pre-ping instead of one per step)
+            with self.engine.connect() as conn:
+                # First, try to clear any existing data from the tables
+                self._clear_existing_data(list(generated_data.keys()), conn=conn)
+                
+                # Insertion order - tables without foreign keys first
+                dependencies, insertion_order = self._get_insertion_plan(generated_data, ddl_content, tables)
+                
+                fast_bulk = fast_bulk and self.engine.dialect.name == 'postgresql'
+                if fast_bulk:
+                    # Referencing tables first: a logged table cannot reference an unlogged one
+                    self._set_tables_logged(list(reversed(insertion_order)), logged=False, conn=conn)
+                
+                try:
+                    # Insert all tables in one transaction: a single commit, and no partial data on failure
+                    results = self.insert_dataframes(generated_data, insertion_order, single_transaction=True,
+                                                     synchronous_commit=not fast_bulk, on_progress=on_progress,
+                                                     conn=conn)
+                finally:
+                    if fast_bulk:
+                        self._set_tables_logged(insertion_order, logged=True, conn=conn)
             
             # Log results
             successful = sum(1 for success in results.values() if success)
@@ -123,41 +447,83 @@ class DatabaseManager:
             return results
             
         except Exception as e:
-            logger.error(f"Failed to store generated data: {e}")
-            st.error(f"❌ Failed to store generated data: {str(e)}")
+            logger.exception("Failed to store generated data")
+            self._report_error(f"❌ Failed to store generated data: {str(e)}")
             return {table_name: False for table_name in generated_data.keys()}
     
-    def _clear_existing_data(self, table_names: List[str]) -> None:
+    @contextmanager
+    def _transaction(self, conn=None):
+        """Run a block in a transaction on the given connection, or on a newly checked out one"""
+        if conn is None:
+            with self.engine.begin() as new_conn:
+                yield new_conn
+            return
+        
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    
+    def _set_tables_logged(self, table_names: List[str], logged: bool, conn=None) -> None:
+        """Switch tables between LOGGED and UNLOGGED, in the given order"""
+        mode = "LOGGED" if logged else "UNLOGGED"
+        try:
+            with self._transaction(conn) as tx:
+                for table_name in table_names:
+                    tx.exec_driver_sql(f"ALTER TABLE {table_name} SET {mode}")
+            logger.info(f"Set {len(table_names)} tables {mode}")
+        except Exception as e:
+            if logged:
+                logger.error(f"Could not make tables durable again (SET LOGGED): {e}")
+            else:
+                logger.warning(f"Could not set tables UNLOGGED, loading with WAL: {e}")
+    
+    def _clear_existing_data(self, table_names: List[str], conn=None) -> None:
         """Clear existing data from tables to prevent duplicate key violations"""
+        if not table_names:
+            return
+        
+        # One TRUNCATE for all tables; fall back to clearing them one by one below
         try:
-            with self.engine.connect() as conn:
+            with self._transaction(conn) as tx:
+                tx.exec_driver_sql(f"TRUNCATE TABLE {', '.join(table_names)} RESTART IDENTITY CASCADE")
+            logger.info(f"Cleared existing data from tables: {table_names}")
+            return
+        except Exception as e:
+            logger.warning(f"Could not clear tables in one statement, clearing them individually: {e}")
+        
+        try:
+            with self._transaction(conn) as tx:
                 for table_name in table_names:
                     try:
                         # Clear all data from the table
-                        conn.execute(text(f"TRUNCATE TABLE {table_name} RESTART IDENTITY CASCADE"))
+                        tx.exec_driver_sql(f"TRUNCATE TABLE {table_name} RESTART IDENTITY CASCADE")
                         logger.info(f"Cleared existing data from table: {table_name}")
                     except Exception as e:
                         logger.warning(f"Could not clear data from table {table_name}: {e}")
                         # Try DELETE as fallback
                         try:
-                            conn.execute(text(f"DELETE FROM {table_name}"))
+                            tx.exec_driver_sql(f"DELETE FROM {table_name}")
                             logger.info(f"Deleted existing data from table: {table_name}")
                         except Exception as delete_e:
                             logger.warning(f"Could not delete data from table {table_name}: {delete_e}")
-                
-                conn.commit()
-                logger.info("Committed data clearing operations")
+            
+            logger.info("Committed data clearing operations")
                 
         except Exception as e:
             logger.warning(f"Error clearing existing data: {e}")
     
-    def validate_dataframe(self, table_name: str, df: pd.DataFrame) -> tuple[bool, List[str]]:
+    def validate_dataframe(self, table_name: str, df: pd.DataFrame,
+                           max_errors: int = MAX_VALIDATION_ERRORS) -> tuple[bool, List[str]]:
         """
         Validate DataFrame data against database schema constraints
         
         Args:
             table_name: Name of the target table
             df: DataFrame to validate
+            max_errors: Maximum number of error messages to collect; checking stops once reached
             
         Returns:
             Tuple of (is_valid, list_of_errors)
@@ -171,18 +537,12 @@ class DatabaseManager:
                 errors.append(f"Could not retrieve schema for table {table_name}")
                 return False, errors
             
-            # Validate each row
-            for idx, row in df.iterrows():
-                row_errors = self._validate_row_data(table_name, row, schema_info, idx)
-                errors.extend(row_errors)
-            
-            # Check for duplicate primary keys
-            pk_errors = self._validate_primary_keys(table_name, df, schema_info)
-            errors.extend(pk_errors)
-            
-            # Check for duplicate unique constraints
-            unique_errors = self._validate_unique_constraints(table_name, df, schema_info)
-            errors.extend(unique_errors)
+            # Validate null, length and date constraints, then duplicate primary keys and unique values,
+            # handing each check only the remaining error budget
+            for validate in (self._validate_column_data, self._validate_primary_keys, self._validate_unique_constraints):
+                if len(errors) >= max_errors:
+                    break
+                errors.extend(validate(table_name, df, schema_info, max_errors - len(errors)))
             
             is_valid = len(errors) == 0
             if not is_valid:
@@ -191,6 +551,8 @@ class DatabaseManager:
                     logger.warning(f"  - {error}")
                 if len(errors) > 5:
                     logger.warning(f"  - ... and {len(errors) - 5} more errors")
+                if len(errors) >= max_errors:
+                    logger.warning(f"  - validation stopped after {max_errors} errors")
             
             return is_valid, errors
             
@@ -200,106 +562,98 @@ class DatabaseManager:
             return False, [error_msg]
     
     def _get_table_schema(self, table_name: str) -> Optional[Dict]:
-        """Get table schema information from database"""
+        """Get table schema information from database (cached until the next DDL execution)"""
+        cached = self._schema_cache.get(table_name)
+        if cached is not None:
+            return cached
+        
         try:
             with self.engine.connect() as conn:
-                # Get column information
-                columns_query = """
-                SELECT 
-                    column_name,
-                    data_type,
-                    character_maximum_length,
-                    is_nullable,
-                    column_default
-                FROM information_schema.columns 
-                WHERE table_name = :table_name
-                ORDER BY ordinal_position
-                """
-                
-                result = conn.execute(text(columns_query), {"table_name": table_name})
-                columns = result.fetchall()
-                
-                # Get primary key information
-                pk_query = """
-                SELECT kcu.column_name
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu 
-                    ON tc.constraint_name = kcu.constraint_name
-                WHERE tc.table_name = :table_name 
-                    AND tc.constraint_type = 'PRIMARY KEY'
-                """
-                
-                pk_result = conn.execute(text(pk_query), {"table_name": table_name})
-                primary_keys = [row[0] for row in pk_result.fetchall()]
+                # Columns, keys and unique constraints/indexes in one round-trip, tagged by kind
+                result = conn.execute(TABLE_SCHEMA_QUERY, {"table_name": table_name})
                 
-                # Get foreign key information
-                fk_query = """
-                SELECT 
-                    kcu.column_name,
-                    ccu.table_name AS foreign_table_name,
-                    ccu.column_name AS foreign_column_name
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu 
-                    ON tc.constraint_name = kcu.constraint_name
-                JOIN information_schema.constraint_column_usage ccu 
-                    ON ccu.constraint_name = tc.constraint_name
-                WHERE tc.table_name = :table_name 
-                    AND tc.constraint_type = 'FOREIGN KEY'
-                """
-                
-                fk_result = conn.execute(text(fk_query), {"table_name": table_name})
-                foreign_keys = {row[0]: {"table": row[1], "column": row[2]} for row in fk_result.fetchall()}
+                columns, primary_keys, foreign_keys = {}, [], {}
+                unique_columns, unique_index_columns = [], []
+                for kind, column_name, data_type, max_length, is_nullable, default, ref_table, ref_column, _ in result:
+                    if kind == 'column':
+                        columns[column_name] = {
+                            "type": data_type,
+                            "max_length": max_length,
+                            "nullable": is_nullable == "YES",
+                            "default": default
+                        }
+                    elif kind == 'primary_key':
+                        primary_keys.append(column_name)
+                    elif kind == 'foreign_key':
+                        foreign_keys[column_name] = {"table": ref_table, "column": ref_column}
+                    elif kind == 'unique':
+                        unique_columns.append(column_name)
+                    else:
+                        unique_index_columns.append(column_name)
                 
-                return {
-                    "columns": {col[0]: {
-                        "type": col[1],
-                        "max_length": col[2],
-                        "nullable": col[3] == "YES",
-                        "default": col[4]
-                    } for col in columns},
+                schema_info = {
+                    "columns": columns,
                     "primary_keys": primary_keys,
-                    "foreign_keys": foreign_keys
+                    "foreign_keys": foreign_keys,
+                    "unique_columns": unique_columns,
+                    "unique_index_columns": unique_index_columns
                 }
+                self._schema_cache[table_name] = schema_info
+                return schema_info
                 
         except Exception as e:
             logger.error(f"Error getting schema for table {table_name}: {e}")
             return None
     
-    def _validate_row_data(self, table_name: str, row: pd.Series, schema_info: Dict, row_idx: int) -> List[str]:
-        """Validate a single row of data"""
+    def _validate_column_data(self, table_name: str, df: pd.DataFrame, schema_info: Dict,
+                              max_errors: int = MAX_VALIDATION_ERRORS) -> List[str]:
+        """Validate null, length and date constraints column by column with vectorized checks"""
         errors = []
         columns = schema_info["columns"]
+        # Only columns the table actually has are checked
+        schema_columns = [column_name for column_name in df.columns if column_name in columns]
         
-        for column_name, value in row.items():
-            if column_name not in columns:
-                continue
-                
+        for column_name in schema_columns:
+            if len(errors) >= max_errors:
+                break
+            
             column_info = columns[column_name]
+            col = df[column_name]
+            null_mask = col.isna()
             
             # Check null constraints
-            if pd.isna(value) and not column_info["nullable"]:
-                errors.append(f"Row {row_idx}: Column '{column_name}' cannot be null")
-                continue
+            if not column_info["nullable"]:
+                for row_idx in df.index[null_mask.to_numpy()][:max_errors - len(errors)]:
+                    errors.append(f"Row {row_idx}: Column '{column_name}' cannot be null")
             
-            if pd.isna(value):
-                continue  # Skip validation for null values
+            # Only string values are checked for length and date format
+            if pd.api.types.is_object_dtype(col):
+                str_mask = col.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+            elif pd.api.types.is_string_dtype(col):
+                str_mask = ~null_mask.to_numpy()
+            else:
+                continue
+            if not str_mask.any():
+                continue
+            strings = col[str_mask].astype(str)
             
             # Check string length constraints
-            if column_info["max_length"] and isinstance(value, str):
-                if len(value) > column_info["max_length"]:
-                    errors.append(f"Row {row_idx}: Column '{column_name}' value too long ({len(value)} > {column_info['max_length']}): '{value[:50]}...'")
+            max_length = column_info["max_length"]
+            if max_length:
+                lengths = strings.str.len()
+                for row_idx, value in strings[lengths > max_length].head(max_errors - len(errors)).items():
+                    errors.append(f"Row {row_idx}: Column '{column_name}' value too long ({len(value)} > {max_length}): '{value[:50]}...'")
             
             # Check date validity
             if column_info["type"] in ["date", "timestamp", "timestamp with time zone"]:
-                if isinstance(value, str):
-                    try:
-                        pd.to_datetime(value)
-                    except:
-                        errors.append(f"Row {row_idx}: Column '{column_name}' invalid date: '{value}'")
+                parsed = pd.to_datetime(strings, errors='coerce', format='mixed', utc=True)
+                for row_idx, value in strings[parsed.isna()].head(max_errors - len(errors)).items():
+                    errors.append(f"Row {row_idx}: Column '{column_name}' invalid date: '{value}'")
         
         return errors
     
-    def _validate_primary_keys(self, table_name: str, df: pd.DataFrame, schema_info: Dict) -> List[str]:
+    def _validate_primary_keys(self, table_name: str, df: pd.DataFrame, schema_info: Dict,
+                               max_errors: int = MAX_VALIDATION_ERRORS) -> List[str]:
         """Validate primary key constraints"""
         errors = []
         primary_keys = schema_info["primary_keys"]
@@ -307,76 +661,39 @@ class DatabaseManager:
         if not primary_keys:
             return errors
         
-        # Check for duplicate primary key values
+        # Check for duplicate primary key values with one hash aggregation
         pk_columns = [col for col in primary_keys if col in df.columns]
         if pk_columns:
-            duplicates = df.duplicated(subset=pk_columns, keep=False)
-            if duplicates.any():
-                duplicate_rows = df[duplicates][pk_columns].drop_duplicates()
-                for _, row in duplicate_rows.iterrows():
-                    pk_values = ", ".join([f"{col}={row[col]}" for col in pk_columns])
-                    errors.append(f"Duplicate primary key: {pk_values}")
+            counts = df.groupby(pk_columns, dropna=False, sort=False).size()
+            for key in counts.index[counts.to_numpy() > 1][:max_errors]:
+                key_values = key if isinstance(key, tuple) else (key,)
+                pk_values = ", ".join([f"{col}={value}" for col, value in zip(pk_columns, key_values)])
+                errors.append(f"Duplicate primary key: {pk_values}")
         
         return errors
     
-    def _validate_unique_constraints(self, table_name: str, df: pd.DataFrame, schema_info: Dict) -> List[str]:
+    def _validate_unique_constraints(self, table_name: str, df: pd.DataFrame, schema_info: Dict,
+                                     max_errors: int = MAX_VALIDATION_ERRORS) -> List[str]:
         """Validate unique constraints (including unique indexes)"""
         errors = []
+        checks = [
+            (schema_info["unique_columns"], "Duplicate unique value"),
+            (schema_info["unique_index_columns"], "Duplicate unique index value")
+        ]
         
-        try:
-            with self.engine.connect() as conn:
-                # Get unique constraints
-                unique_query = """
-                SELECT 
-                    kcu.column_name,
-                    tc.constraint_name
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu 
-                    ON tc.constraint_name = kcu.constraint_name
-                WHERE tc.table_name = :table_name 
-                    AND tc.constraint_type = 'UNIQUE'
-                """
-                
-                result = conn.execute(text(unique_query), {"table_name": table_name})
-                unique_constraints = result.fetchall()
-                
-                # Check for duplicate values in unique columns
-                for column_name, constraint_name in unique_constraints:
-                    if column_name in df.columns:
-                        duplicates = df.duplicated(subset=[column_name], keep=False)
-                        if duplicates.any():
-                            duplicate_values = df[duplicates][column_name].drop_duplicates()
-                            for value in duplicate_values:
-                                errors.append(f"Duplicate unique value in column '{column_name}': '{value}'")
-                
-                # Also check for unique indexes
-                index_query = """
-                SELECT 
-                    a.attname as column_name,
-                    i.relname as index_name
-                FROM pg_class t
-                JOIN pg_index ix ON t.oid = ix.indrelid
-                JOIN pg_class i ON i.oid = ix.indexrelid
-                JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(ix.indkey)
-                WHERE t.relname = :table_name
-                    AND ix.indisunique = true
-                    AND i.relname NOT LIKE '%_pkey'
-                """
-                
-                index_result = conn.execute(text(index_query), {"table_name": table_name})
-                unique_indexes = index_result.fetchall()
-                
-                # Check for duplicate values in unique index columns
-                for column_name, index_name in unique_indexes:
-                    if column_name in df.columns:
-                        duplicates = df.duplicated(subset=[column_name], keep=False)
-                        if duplicates.any():
-                            duplicate_values = df[duplicates][column_name].drop_duplicates()
-                            for value in duplicate_values:
-                                errors.append(f"Duplicate unique index value in column '{column_name}': '{value}'")
-                
-        except Exception as e:
-            logger.warning(f"Could not validate unique constraints for table {table_name}: {e}")
+        # Count values once per column, even if it has both a unique constraint and a unique index
+        duplicate_values = {}
+        for unique_columns, message in checks:
+            for column_name in unique_columns:
+                if column_name not in df.columns:
+                    continue
+                if column_name not in duplicate_values:
+                    counts = df[column_name].value_counts(sort=False, dropna=False)
+                    duplicate_values[column_name] = counts.index[counts.to_numpy() > 1]
+                for value in duplicate_values[column_name][:max_errors - len(errors)]:
+                    errors.append(f"{message} in column '{column_name}': '{value}'")
+                if len(errors) >= max_errors:
+                    return errors
         
         return errors
     
@@ -398,26 +715,21 @@ class DatabaseManager:
                 logger.warning(f"Could not get schema for table {table_name}, skipping data cleaning")
                 return df
             
-            cleaned_df = df.copy()
+            # Shallow copy: every fix below assigns a whole new column, so df itself is never written to
+            # (category columns are expanded first; fillna with a value outside the categories raises)
+            cleaned_df = expand_categories(df).copy(deep=False)
             columns = schema_info["columns"]
             
-            for column_name in cleaned_df.columns:
-                if column_name not in columns:
-                    continue
-                    
+            for column_name in [column_name for column_name in df.columns if column_name in columns]:
                 column_info = columns[column_name]
                 
                 # Fix string length issues
                 if column_info["max_length"] and column_info["type"] in ["character varying", "varchar", "text"]:
-                    cleaned_df[column_name] = cleaned_df[column_name].astype(str).apply(
-                        lambda x: x[:column_info["max_length"]] if len(str(x)) > column_info["max_length"] else x
-                    )
+                    cleaned_df[column_name] = cleaned_df[column_name].astype("string").str.slice(0, column_info["max_length"])
                 
                 # Fix date issues
                 if column_info["type"] in ["date", "timestamp", "timestamp with time zone"]:
-                    cleaned_df[column_name] = cleaned_df[column_name].apply(
-                        lambda x: self._fix_invalid_date(x) if pd.notna(x) else x
-                    )
+                    cleaned_df[column_name] = self._fix_invalid_dates(cleaned_df[column_name])
                 
                 # Fix null constraint issues
                 if not column_info["nullable"]:
@@ -443,76 +755,70 @@ class DatabaseManager:
             logger.warning(f"Error cleaning data for table {table_name}: {e}")
             return df
     
-    def _fix_invalid_date(self, date_value) -> str:
-        """Fix invalid dates like Feb 29 in non-leap years"""
-        try:
-            if pd.isna(date_value):
-                return "1900-01-01"
-            
-            date_str = str(date_value)
-            
-            # Check for Feb 29 in non-leap years
-            if "-02-29" in date_str:
-                year = int(date_str.split("-")[0])
-                if not self._is_leap_year(year):
-                    # Change to Feb 28
-                    fixed_date = date_str.replace("-02-29", "-02-28")
-                    logger.warning(f"Fixed invalid date {date_str} to {fixed_date}")
-                    return fixed_date
-            
-            # Validate the date
-            pd.to_datetime(date_str)
-            return date_str
-            
-        except Exception as e:
-            logger.warning(f"Could not fix date {date_value}: {e}")
-            return "1900-01-01"
+    def _fix_invalid_dates(self, dates: pd.Series) -> pd.Series:
+        """Fix invalid dates like Feb 29 in non-leap years across a whole column"""
+        present = dates.notna().to_numpy()
+        if not present.any():
+            return dates
+        
+        date_strs = dates[present].astype(str)
+        
+        # Change Feb 29 in non-leap years to Feb 28: plain substring test, then year parsing and
+        # the leap-year test as NumPy masks over only the Feb 29 rows
+        feb29 = date_strs.str.contains("-02-29", regex=False).to_numpy(dtype=bool)
+        bad_feb29 = np.zeros_like(feb29)
+        if feb29.any():
+            years = pd.to_numeric(date_strs[feb29].str.partition("-")[0], errors='coerce').to_numpy(dtype=float)
+            bad_feb29[feb29] = ~np.isnan(years) & ~self._is_leap_year(np.nan_to_num(years).astype(np.int64))
+        if bad_feb29.any():
+            date_strs = date_strs.copy()
+            date_strs[bad_feb29] = date_strs[bad_feb29].str.replace("-02-29", "-02-28", regex=False)
+            logger.warning(f"Fixed {int(bad_feb29.sum())} Feb 29 dates in non-leap years to Feb 28")
+        
+        # Dates that still do not parse fall back to a default
+        unparseable = pd.to_datetime(date_strs, errors='coerce', format='mixed', utc=True).isna()
+        if unparseable.any():
+            date_strs = date_strs.mask(unparseable, "1900-01-01")
+            logger.warning(f"Replaced {int(unparseable.sum())} unparseable dates with 1900-01-01")
+        
+        fixed = dates.to_numpy(dtype=object, copy=True)
+        fixed[present] = date_strs.to_numpy()
+        return pd.Series(fixed, index=dates.index, name=dates.name)
     
-    def _is_leap_year(self, year: int) -> bool:
-        """Check if a year is a leap year"""
-        return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    def _is_leap_year(self, year):
+        """Check if a year (or each year in an array/Series) is a leap year"""
+        return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
     
     def _fix_duplicate_unique_values(self, table_name: str, df: pd.DataFrame, schema_info: Dict) -> pd.DataFrame:
         """Fix duplicate unique values by generating new unique values"""
         try:
-            with self.engine.connect() as conn:
-                # Get unique constraints
-                unique_query = """
-                SELECT 
-                    kcu.column_name,
-                    tc.constraint_name
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu 
-                    ON tc.constraint_name = kcu.constraint_name
-                WHERE tc.table_name = :table_name 
-                    AND tc.constraint_type = 'UNIQUE'
-                """
-                
-                result = conn.execute(text(unique_query), {"table_name": table_name})
-                unique_constraints = result.fetchall()
-                
-                cleaned_df = df.copy()
-                
-                # Fix duplicate values in unique columns
-                for column_name, constraint_name in unique_constraints:
-                    if column_name in cleaned_df.columns:
-                        # Find duplicates
-                        duplicates = cleaned_df.duplicated(subset=[column_name], keep=False)
-                        if duplicates.any():
-                            logger.warning(f"Found duplicate values in unique column '{column_name}' for table '{table_name}'")
-                            
-                            # Get existing values from database
-                            existing_query = f"SELECT DISTINCT {column_name} FROM {table_name}"
-                            existing_result = conn.execute(text(existing_query))
-                            existing_values = set(row[0] for row in existing_result.fetchall())
-                            
-                            # Fix duplicates by generating new unique values
-                            for idx in cleaned_df[duplicates].index:
-                                original_value = cleaned_df.loc[idx, column_name]
-                                new_value = self._generate_unique_value(original_value, existing_values, column_name)
-                                cleaned_df.loc[idx, column_name] = new_value
-                                existing_values.add(new_value)
-                                logger.info(f"Fixed duplicate value '{original_value}' to '{new_value}' in column '{column_name}'")
+            # Shallow copy: fixed columns are assigned as new arrays
+            cleaned_df = df.copy(deep=False)
+            
+            # Fix duplicate values in unique columns
+            for column_name in schema_info["unique_columns"]:
+                if column_name in cleaned_df.columns:
+                    # Find duplicates
+                    duplicates = cleaned_df.duplicated(subset=[column_name], keep=False)
+                    if duplicates.any():
+                        logger.warning(f"Found duplicate values in unique column '{column_name}' for table '{table_name}'")
+                        
+                        # Get existing values from database
+                        with self.engine.connect() as conn:
+                            existing_result = conn.exec_driver_sql(f"SELECT DISTINCT {column_name} FROM {table_name}")
+                            existing_values = set(existing_result.scalars())
+                        
+                        # Generate replacements in plain Python, then write them back in one assignment
+                        original_values = cleaned_df.loc[duplicates, column_name].tolist()
+                        new_values = np.empty(len(original_values), dtype=object)
+                        for i, original_value in enumerate(original_values):
+                            new_value = self._generate_unique_value(original_value, existing_values, column_name)
+                            new_values[i] = new_value
+                            existing_values.add(new_value)
+                        fixed = cleaned_df[column_name].to_numpy(dtype=object, copy=True)
+                        fixed[duplicates.to_numpy()] = new_values
+                        cleaned_df[column_name] = fixed
+                        logger.info(f"Fixed {len(new_values)} duplicate values in column '{column_name}'")
                 
         except Exception as e:
             logger.warning(f"Error fixing duplicate unique values for table {table_name}: {e}")
@@ -522,9 +828,6 @@ class DatabaseManager:
     
     def _generate_unique_value(self, original_value, existing_values: set, column_name: str) -> str:
         """Generate a unique value based on the original value"""
-        import random
-        import string
-        
         if column_name.lower() == 'isbn':
             # For ISBN, generate a new valid ISBN
             return self._generate_unique_isbn(existing_values)
@@ -540,11 +843,9 @@ class DatabaseManager:
     
     def _generate_unique_isbn(self, existing_values: set) -> str:
         """Generate a unique ISBN"""
-        import random
-        
+        # The counter only moves forward, so each taken value is skipped at most once
         while True:
-            # Generate a random ISBN-13
-            isbn = f"978-{random.randint(100000000, 999999999)}"
+            isbn = f"978-{next(self._isbn_counter):09d}"
             if isbn not in existing_values:
                 return isbn
     
@@ -563,35 +864,47 @@ class DatabaseManager:
                         if table_name:
                             table_names.append(table_name)
                 
-                # Drop existing tables if requested
-                if drop_existing:
-                    logger.info(f"Dropping existing tables: {table_names}")
-                    for table_name in reversed(table_names):
-                        try:
-                            # First, drop any dependent objects
-                            conn.execute(text(f"DROP TABLE IF EXISTS {table_name} CASCADE"))
-                            logger.info(f"Dropped existing table: {table_name}")
-                            
-                            # Also try to drop any sequences that might be left behind
-                            try:
-                                conn.execute(text(f"DROP SEQUENCE IF EXISTS {table_name}_id_seq CASCADE"))
-                                conn.execute(text(f"DROP SEQUENCE IF EXISTS {table_name}_seq CASCADE"))
-                                conn.execute(text(f"DROP SEQUENCE IF EXISTS {table_name}_pk_seq CASCADE"))
-                            except Exception as seq_e:
-                                logger.debug(f"Could not drop sequences for {table_name}: {seq_e}")
-                                
-                        except Exception as e:
-                            logger.warning(f"Could not drop table {table_name}: {e}")
-                    
-                    # Commit the drops before creating new tables
+                # Same schema as the last run: empty the tables instead of dropping and recreating them
+                is_postgres = self.engine.dialect.name == 'postgresql'
+                schema_hash = hashlib.blake2b('\n'.join(statements).encode('utf-8'), digest_size=16).hexdigest()
+                if drop_existing and table_names and is_postgres and self._schema_unchanged(conn, schema_hash, table_names):
+                    conn.exec_driver_sql(f"TRUNCATE TABLE {', '.join(table_names)} RESTART IDENTITY CASCADE")
                     conn.commit()
-                    logger.info("Committed table drops")
+                    logger.info(f"Schema unchanged, truncated existing tables: {table_names}")
+                    return True
                 
-                # Execute DDL statements
-                for statement in statements:
-                    if statement.strip():
-                        conn.execute(text(statement))
-                        logger.info(f"Executed statement: {statement[:100]}...")
+                # Drop existing tables (and sequences they may leave behind) in one statement each
+                drop_statements = []
+                if drop_existing and table_names:
+                    logger.info(f"Dropping existing tables: {table_names}")
+                    tables_sql = ', '.join(reversed(table_names))
+                    sequences_sql = ', '.join(
+                        f"{table_name}{suffix}"
+                        for table_name in reversed(table_names)
+                        for suffix in ('_id_seq', '_seq', '_pk_seq')
+                    )
+                    drop_statements = [
+                        f"DROP TABLE IF EXISTS {tables_sql} CASCADE",
+                        f"DROP SEQUENCE IF EXISTS {sequences_sql} CASCADE"
+                    ]
+                
+                # Send drops and creates in one round-trip and one transaction on PostgreSQL
+                batch = drop_statements + [statement for statement in statements if statement.strip()]
+                if is_postgres:
+                    try:
+                        self._execute_script(conn, ';\n'.join(batch))
+                    except Exception as e:
+                        # Replay one statement at a time so the failing statement is the one reported
+                        logger.warning(f"Batched DDL failed, retrying statement by statement: {e}")
+                        conn.rollback()
+                        self._execute_statements(conn, batch)
+                else:
+                    self._execute_statements(conn, batch)
+                
+                if logger.isEnabledFor(logging.DEBUG):
+                    for statement in batch:
+                        logger.debug(f"Executed statement: {statement[:100]}...")
+                logger.info(f"Executed {len(batch)} DDL statements")
                 
                 # Reset sequences for primary key columns after table creation
                 if drop_existing:
@@ -600,65 +913,83 @@ class DatabaseManager:
                 else:
                     logger.info("Skipping sequence reset because drop_existing=False")
                 
+                if is_postgres:
+                    self._record_schema_hash(conn, schema_hash)
+                
                 conn.commit()
                 return True
                 
         except Exception as e:
+            self._invalidate_connection_check(e)
             logger.error(f"SQLAlchemy DDL execution failed: {e}")
             return False
     
+    def _execute_script(self, conn, sql: str) -> None:
+        """Run SQL on the DBAPI cursor inside the connection's transaction.
+        
+        No parameters are passed, so the driver does no placeholder substitution and
+        literal '%' (e.g. CHECK (email LIKE '%@%')) reaches the server unchanged.
+        """
+        if not conn.in_transaction():
+            conn.begin()
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(sql)
+        finally:
+            cursor.close()
+    
+    def _execute_statements(self, conn, statements: List[str]) -> None:
+        """Execute DDL statements one by one, logging the statement that fails"""
+        for statement in statements:
+            try:
+                self._execute_script(conn, statement)
+            except Exception:
+                logger.error(f"DDL statement failed: {statement[:200]}")
+                raise
+    
+    def _schema_unchanged(self, conn, schema_hash: str, table_names: List[str]) -> bool:
+        """Whether the stored schema hash matches and all tables still exist"""
+        if conn.execute(SCHEMA_META_EXISTS_QUERY, {"name": SCHEMA_META_TABLE}).scalar() is None:
+            return False
+        
+        stored_hash = conn.execute(STORED_SCHEMA_HASH_QUERY).scalar()
+        if stored_hash != schema_hash:
+            return False
+        
+        # Unquoted identifiers are folded to lower case by PostgreSQL
+        expected = {table_name.lower() for table_name in table_names}
+        existing = conn.execute(EXISTING_TABLES_COUNT_QUERY, {"names": list(expected)}).scalar()
+        return existing == len(expected)
+    
+    def _record_schema_hash(self, conn, schema_hash: str) -> None:
+        """Store the hash of the DDL just applied"""
+        conn.exec_driver_sql(
+            f"CREATE TABLE IF NOT EXISTS {SCHEMA_META_TABLE} (id INTEGER PRIMARY KEY, ddl_hash TEXT NOT NULL)"
+        )
+        conn.execute(RECORD_SCHEMA_HASH_QUERY, {"ddl_hash": schema_hash})
+    
     def _reset_sequences(self, conn, table_names: List[str]) -> None:
         """Reset sequences for primary key columns to start from 1"""
         try:
             logger.info(f"Starting sequence reset for {len(table_names)} tables")
-            for table_name in table_names:
-                logger.info(f"Processing table: {table_name}")
-                
-                # First, try to find all sequences associated with this table
-                sequences_query = """
-                SELECT 
-                    sequence_name,
-                    column_name
-                FROM information_schema.sequences s
-                JOIN information_schema.columns c ON s.sequence_name LIKE '%' || c.table_name || '%'
-                WHERE c.table_name = :table_name
-                AND c.column_default LIKE '%' || s.sequence_name || '%'
-                """
-                
-                try:
-                    result = conn.execute(text(sequences_query), {"table_name": table_name})
-                    sequences = result.fetchall()
-                    
-                    for seq_name, col_name in sequences:
-                        try:
-                            conn.execute(text(f"ALTER SEQUENCE {seq_name} RESTART WITH 1"))
-                            logger.info(f"Reset sequence {seq_name} for {table_name}.{col_name} to start from 1")
-                        except Exception as e:
-                            logger.warning(f"Could not reset sequence {seq_name}: {e}")
-                            
-                except Exception as e:
-                    logger.warning(f"Could not query sequences for table {table_name}: {e}")
-                
-                # Fallback: try common sequence naming patterns
-                common_patterns = [
-                    f"{table_name}_id_seq",
-                    f"{table_name}_seq",
-                    f"{table_name}_pk_seq"
+            
+            # Savepoint: a failed reset rolls back only itself, not the DDL transaction it runs in
+            with conn.begin_nested():
+                # Sequences used by the tables' columns plus common naming patterns, found in one query
+                candidates = [
+                    f"{table_name}{suffix}"
+                    for table_name in table_names
+                    for suffix in ('_id_seq', '_seq', '_pk_seq')
                 ]
+                sequences = conn.execute(
+                    TABLE_SEQUENCES_QUERY, {"table_names": list(table_names), "candidates": candidates}
+                ).scalars().all()
+                
+                # Restart them all in one round-trip
+                if sequences:
+                    conn.exec_driver_sql(';\n'.join(f"ALTER SEQUENCE {seq_name} RESTART WITH 1" for seq_name in sequences))
+                    logger.info(f"Reset sequences to start from 1: {sequences}")
                 
-                for seq_name in common_patterns:
-                    try:
-                        # Check if sequence exists
-                        seq_check = conn.execute(text("""
-                            SELECT 1 FROM pg_sequences WHERE sequencename = :seq_name
-                        """), {"seq_name": seq_name})
-                        
-                        if seq_check.fetchone():
-                            conn.execute(text(f"ALTER SEQUENCE {seq_name} RESTART WITH 1"))
-                            logger.info(f"Reset sequence {seq_name} to start from 1")
-                    except Exception as e:
-                        continue
-                        
         except Exception as e:
             logger.error(f"Error resetting sequences: {e}")
             # Don't let sequence reset failure prevent table creation
@@ -680,10 +1011,7 @@ class DatabaseManager:
                 for table_name, expected_schema in schema_info.items():
                     try:
                         # Check if table exists
-                        table_check = conn.execute(text("""
-                            SELECT 1 FROM information_schema.tables 
-                            WHERE table_name = %s
-                        """), (table_name,))
+                        table_check = conn.execute(TABLE_EXISTS_QUERY, {"table_name": table_name})
                         
                         if not table_check.fetchone():
                             results[table_name] = {
@@ -693,21 +1021,16 @@ class DatabaseManager:
                             continue
                         
                         # Get actual columns
-                        columns_query = conn.execute(text("""
-                            SELECT column_name, data_type, is_nullable
-                            FROM information_schema.columns
-                            WHERE table_name = %s
-                            ORDER BY ordinal_position
-                        """), (table_name,))
+                        columns_query = conn.execute(TABLE_COLUMNS_QUERY, {"table_name": table_name})
                         
                         actual_columns = {row[0]: {'type': row[1], 'nullable': row[2] == 'YES'} 
                                         for row in columns_query.fetchall()}
                         
                         # Compare with expected schema
-                        expected_columns = {col['name']: col for col in expected_schema['columns']}
+                        expected_columns = set(expected_schema['names'])
                         
-                        missing_columns = set(expected_columns.keys()) - set(actual_columns.keys())
-                        extra_columns = set(actual_columns.keys()) - set(expected_columns.keys())
+                        missing_columns = expected_columns - set(actual_columns.keys())
+                        extra_columns = set(actual_columns.keys()) - expected_columns
                         
                         if missing_columns or extra_columns:
                             results[table_name] = {
@@ -734,13 +1057,14 @@ class DatabaseManager:
         
         return results
     
-    def insert_dataframe(self, table_name: str, df: pd.DataFrame) -> bool:
+    def insert_dataframe(self, table_name: str, df: pd.DataFrame, conn=None) -> bool:
         """
         Insert DataFrame into database table with validation
         
         Args:
             table_name: Name of the target table
             df: DataFrame to insert
+            conn: Optional connection of an open transaction (committed by the caller)
             
         Returns:
             True if successful, False otherwise
@@ -754,156 +1078,396 @@ class DatabaseManager:
             
             if not is_valid:
                 logger.error(f"Data validation failed for table {table_name}")
-                st.error(f"❌ **Data Validation Failed for {table_name}**")
-                st.error(f"Found {len(validation_errors)} validation errors:")
-                
+                lines = [
+                    f"❌ **Data Validation Failed for {table_name}**",
+                    f"Found {len(validation_errors)}{'+' if len(validation_errors) >= MAX_VALIDATION_ERRORS else ''} validation errors:"
+                ]
                 # Show first 5 errors to user
-                for error in validation_errors[:5]:
-                    st.error(f"  • {error}")
-                
+                lines.extend(f"  • {error}" for error in validation_errors[:5])
                 if len(validation_errors) > 5:
-                    st.error(f"  • ... and {len(validation_errors) - 5} more errors")
-                
-                st.error("**Solution:** The AI will regenerate data with proper validation.")
+                    lines.append(f"  • ... and {len(validation_errors) - 5} more errors")
+                lines.append("**Solution:** The AI will regenerate data with proper validation.")
+                self._report_error("\n\n".join(lines))
                 return False
             
             # Use cleaned data for insertion
             df = cleaned_df
             
-            # Use SQLAlchemy connection
-            df.to_sql(table_name, self.engine, if_exists='append', index=False, method='multi')
+            # Bulk load: COPY on PostgreSQL (tables already exist), chunked multi-row INSERTs elsewhere
+            if self.engine.dialect.name == 'postgresql' and settings.DB_USE_COPY:
+                self._copy_insert(table_name, df, conn)
+            elif self.engine.dialect.name == 'postgresql':
+                self._values_insert(table_name, df, conn)
+            else:
+                # Rows per statement sized to the column count so wide tables stay under the parameter limit
+                chunksize = max(1, MULTI_INSERT_PARAM_LIMIT // max(1, len(df.columns)))
+                df.to_sql(table_name, conn if conn is not None else self.engine, if_exists='append',
+                          index=False, method='multi', chunksize=chunksize)
             
             logger.info(f"Successfully inserted {len(df)} rows into table: {table_name}")
             return True
             
         except Exception as e:
+            self._invalidate_connection_check(e)
             error_msg = str(e)
-            logger.error(f"Failed to insert data into table {table_name}: {e}")
+            logger.exception(f"Failed to insert data into table {table_name}")
             
             # Provide more helpful error messages for common issues
-            if "duplicate key value violates unique constraint" in error_msg:
-                st.error(f"❌ **Primary Key Conflict in {table_name}**")
-                st.error("The table already contains data with the same primary key values.")
-                st.error("**Solution:** Try running the data generation again - the system will now properly drop and recreate tables.")
-                st.error("**Technical Details:** " + error_msg)
-            elif "foreign key constraint" in error_msg:
-                st.error(f"❌ **Foreign Key Constraint Violation in {table_name}**")
-                st.error("The data references non-existent records in related tables.")
-                st.error("**Solution:** Ensure all referenced tables are created and populated first.")
-                st.error("**Technical Details:** " + error_msg)
-            elif "value too long for type" in error_msg:
-                st.error(f"❌ **Data Too Long for Column in {table_name}**")
-                st.error("Some data exceeds the maximum length allowed by the database schema.")
-                st.error("**Solution:** The system will now validate data before insertion to prevent this.")
-                st.error("**Technical Details:** " + error_msg)
-            elif "date/time field value out of range" in error_msg:
-                st.error(f"❌ **Invalid Date in {table_name}**")
-                st.error("Some dates are invalid (e.g., February 29th in non-leap years).")
-                st.error("**Solution:** The system will now validate dates before insertion.")
-                st.error("**Technical Details:** " + error_msg)
+            for marker, title, explanation, solution in INSERT_ERROR_HINTS:
+                if marker in error_msg:
+                    self._report_error("\n\n".join([
+                        f"❌ **{title} in {table_name}**",
+                        explanation,
+                        f"**Solution:** {solution}",
+                        f"**Technical Details:** {error_msg}"
+                    ]))
+                    break
             else:
-                st.error(f"❌ Failed to insert data into {table_name}: {error_msg}")
+                self._report_error(f"❌ Failed to insert data into {table_name}: {error_msg}")
             
             return False
     
+    def _copy_insert(self, table_name: str, df: pd.DataFrame, conn=None) -> None:
+        """Stream a DataFrame into an existing table with COPY FROM STDIN.
+        
+        Runs in the caller's transaction when conn is given, otherwise in its own.
+        """
+        columns = ', '.join(f'"{col}"' for col in df.columns)
+        
+        # All-numeric tables without NULLs skip text formatting and server-side parsing
+        schema_info = self._get_table_schema(table_name)
+        column_types = {name: info['type'] for name, info in schema_info['columns'].items()} if schema_info else {}
+        df = _match_column_types(df, column_types)
+        binary_fields = _binary_copy_fields(df, column_types)
+        if binary_fields is not None:
+            copy_sql = f'COPY "{table_name}" ({columns}) FROM STDIN WITH (FORMAT binary)'
+        else:
+            copy_sql = f"""COPY "{table_name}" ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"""
+        
+        def serialized_chunks() -> Iterator[bytes]:
+            if binary_fields is not None:
+                yield PGCOPY_HEADER
+            for start in range(0, len(df), INSERT_CHUNK_SIZE):
+                chunk = df.iloc[start:start + INSERT_CHUNK_SIZE]
+                if binary_fields is not None:
+                    yield _binary_copy_rows(chunk, binary_fields)
+                else:
+                    # pandas' C CSV writer
+                    yield chunk.to_csv(index=False, header=False, na_rep=COPY_NULL).encode('utf-8')
+            if binary_fields is not None:
+                yield PGCOPY_TRAILER
+        
+        def copy_chunks(cursor):
+            # One COPY command for the whole table, serialized lazily as the server consumes it
+            cursor.copy_expert(copy_sql, _ChunkStream(serialized_chunks()), size=COPY_READ_SIZE)
+        
+        if conn is not None:
+            with conn.connection.cursor() as cursor:
+                copy_chunks(cursor)
+            return
+        
+        raw_conn = self.engine.raw_connection()
+        try:
+            with raw_conn.cursor() as cursor:
+                copy_chunks(cursor)
+            raw_conn.commit()
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+    
+    def _values_insert(self, table_name: str, df: pd.DataFrame, conn=None) -> None:
+        """Insert a DataFrame with psycopg2's execute_values, one multi-row INSERT per page.
+        
+        Runs in the caller's transaction when conn is given, otherwise in its own.
+        """
+        # psycopg2 is only needed on this path
+        from psycopg2.extras import execute_values
+        
+        columns = ', '.join(f'"{col}"' for col in df.columns)
+        insert_sql = f'INSERT INTO "{table_name}" ({columns}) VALUES %s'
+        # Python scalars with None for NULL, which psycopg2 adapts directly
+        rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        
+        if conn is not None:
+            with conn.connection.cursor() as cursor:
+                execute_values(cursor, insert_sql, rows, page_size=VALUES_INSERT_PAGE_SIZE)
+            return
+        
+        raw_conn = self.engine.raw_connection()
+        try:
+            with raw_conn.cursor() as cursor:
+                execute_values(cursor, insert_sql, rows, page_size=VALUES_INSERT_PAGE_SIZE)
+            raw_conn.commit()
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+    
     def insert_dataframes(self, dataframes: Dict[str, pd.DataFrame], 
-                         insertion_order: Optional[List[str]] = None) -> Dict[str, bool]:
+                         insertion_order: Optional[List[str]] = None,
+                         dependencies: Optional[Dict[str, List[str]]] = None,
+                         max_workers: Optional[int] = None, single_transaction: bool = False,
+                         synchronous_commit: bool = True,
+                         on_progress: Optional[Callable[[str, bool], None]] = None,
+                         conn=None) -> Dict[str, bool]:
         """
         Insert multiple DataFrames into their respective tables
         
         Args:
             dataframes: Dictionary mapping table names to DataFrames
             insertion_order: Optional order for table insertion
+            dependencies: Optional mapping of table -> tables it references; when given,
+                tables are inserted in parallel as soon as all their parents are done. If any
+                table references a table outside this load, all tables are inserted sequentially
+            max_workers: Maximum number of tables inserted concurrently. If None, uses the
+                connection pool size (each worker holds one pooled connection)
+            single_transaction: Insert all tables sequentially in one transaction that is
+                rolled back entirely if any table fails
+            synchronous_commit: With single_transaction on PostgreSQL, False skips waiting
+                for the WAL flush when the transaction commits
+            on_progress: Optional callback invoked on the calling thread with (table name, success)
+                as each table finishes, so the UI can update while workers are still inserting
+            conn: With single_transaction, an already checked out connection to run the transaction on
             
         Returns:
             Dictionary mapping table names to success status
         """
-        results = {}
-        
         # Use provided order or default to alphabetical
         if insertion_order:
             table_names = insertion_order
         else:
             table_names = sorted(dataframes.keys())
         
-        for table_name in table_names:
-            if table_name in dataframes:
-                df = dataframes[table_name]
-                success = self.insert_dataframe(table_name, df)
-                results[table_name] = success
-            else:
-                logger.warning(f"Table {table_name} not found in dataframes")
-                results[table_name] = False
+        if on_progress is None:
+            on_progress = lambda table_name, success: None
+        
+        if single_transaction:
+            return self._insert_in_transaction(table_names, dataframes, synchronous_commit, on_progress, conn)
+        
+        if max_workers is None:
+            max_workers = min(self.pool_size, len(table_names))
+        
+        results = {}
+        if dependencies is not None:
+            # A reference to a table outside this load means the graph may be incomplete
+            unresolved = {
+                dep for table_name in table_names for dep in dependencies.get(table_name, []) if dep not in table_names
+            }
+            if unresolved:
+                logger.warning(f"Tables reference {sorted(unresolved)} outside this load, inserting sequentially")
+                dependencies = None
+        
+        if dependencies is None or max_workers <= 1:
+            for table_name in table_names:
+                results[table_name] = self._insert_table(table_name, dataframes)
+                on_progress(table_name, results[table_name])
+            return results
+        
+        # table -> parents it is still waiting for
+        pending = {
+            table_name: {dep for dep in dependencies.get(table_name, []) if dep != table_name}
+            for table_name in table_names
+        }
+        
+        with ThreadPoolExecutor(max_workers=max_workers, initializer=_script_context_initializer()) as executor:
+            running = {}
+            
+            def submit_ready():
+                for table_name in [name for name, parents in pending.items() if not parents]:
+                    del pending[table_name]
+                    running[executor.submit(self._insert_table, table_name, dataframes)] = table_name
+            
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    table_name = running.pop(future)
+                    results[table_name] = future.result()
+                    on_progress(table_name, results[table_name])
+                    for parents in pending.values():
+                        parents.discard(table_name)
+                submit_ready()
+        
+        # Tables left in a dependency cycle are inserted sequentially
+        for table_name in pending:
+            results[table_name] = self._insert_table(table_name, dataframes)
+            on_progress(table_name, results[table_name])
+        
+        return {table_name: results[table_name] for table_name in table_names}
+    
+    def _insert_in_transaction(self, table_names: List[str], dataframes: Dict[str, pd.DataFrame],
+                               synchronous_commit: bool = True,
+                               on_progress: Optional[Callable[[str, bool], None]] = None,
+                               conn=None) -> Dict[str, bool]:
+        """Insert tables in order on one connection, committing once at the end"""
+        results = {}
+        try:
+            with self._transaction(conn) as tx:
+                if not synchronous_commit and self.engine.dialect.name == 'postgresql':
+                    tx.exec_driver_sql("SET LOCAL synchronous_commit = OFF")
+                for table_name in table_names:
+                    results[table_name] = self._insert_table(table_name, dataframes, conn=tx)
+                    if on_progress is not None:
+                        on_progress(table_name, results[table_name])
+                    if not results[table_name]:
+                        # Raising out of the transaction rolls back every table inserted so far
+                        raise RuntimeError(f"insertion into {table_name} failed")
+        except Exception as e:
+            logger.error(f"Data insertion rolled back: {e}")
+            self._report_error(f"❌ Data insertion rolled back, no tables were changed: {str(e)}")
+            return {table_name: False for table_name in table_names}
         
         return results
     
+    def _insert_table(self, table_name: str, dataframes: Dict[str, pd.DataFrame], conn=None) -> bool:
+        """Insert one table from the DataFrame mapping"""
+        if table_name not in dataframes:
+            logger.warning(f"Table {table_name} not found in dataframes")
+            return False
+        return self.insert_dataframe(table_name, dataframes[table_name], conn=conn)
+    
     def execute_query(self, query: str, ttl: int = 600) -> Optional[pd.DataFrame]:
         """Execute SQL query and return results"""
         try:
-            # Use SQLAlchemy connection
+            # Plain read_sql on purpose: collecting streamed chunks and concatenating them held every
+            # chunk plus the combined copy, and Arrow-native readers (connectorx, ADBC) are not dependencies
             with self.engine.connect() as conn:
-                result = pd.read_sql(query, conn)
-                return result
-                    
+                return pd.read_sql(query, conn)
+            
         except Exception as e:
-            logger.error(f"Query execution failed: {e}")
-            st.error(f"❌ Query execution failed: {str(e)}")
+            self._invalidate_connection_check(e)
+            logger.exception("Query execution failed")
+            self._report_error(f"❌ Query execution failed: {str(e)}")
             return None
     
     def is_connected(self) -> bool:
-        """Check if database is connected"""
+        """Check if database is connected (checks out a pooled connection at most every few seconds)"""
+        if time.monotonic() - self._last_ok_ts < CONNECTION_CHECK_TTL:
+            return True
         try:
             with self.engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+                conn.execute(SELECT_ONE_QUERY)
+            self._last_ok_ts = time.monotonic()
             return True
         except Exception:
+            self._last_ok_ts = 0.0
             return False
     
+    def _invalidate_connection_check(self, error: Exception) -> None:
+        """Force the next is_connected call to query the server after a database error"""
+        # COPY and execute_values run on raw DBAPI cursors, whose errors (e.g. psycopg2.Error)
+        # are not wrapped in SQLAlchemyError
+        dbapi = getattr(self.engine.dialect, 'dbapi', None) if self.engine is not None else None
+        error_types = (SQLAlchemyError, dbapi.Error) if dbapi is not None else (SQLAlchemyError,)
+        if isinstance(error, error_types):
+            self._last_ok_ts = 0.0
+    
     def _parse_ddl_statements(self, ddl_content: str) -> List[str]:
-        """Parse DDL content into individual statements"""
-        import re
-        
-        # Remove comments
-        ddl_content = re.sub(r'--.*$', '', ddl_content, flags=re.MULTILINE)
-        ddl_content = re.sub(r'/\*.*?\*/', '', ddl_content, flags=re.DOTALL)
+        """Parse DDL content into individual statements in one pass over the text"""
+        statements = []
+        parts = []
         
-        # Normalize whitespace
-        ddl_content = re.sub(r'\s+', ' ', ddl_content)
-        ddl_content = ddl_content.strip()
+        for token in DDL_TOKEN_PATTERN.finditer(ddl_content):
+            kind = token.lastgroup
+            if kind in ('comment', 'space'):
+                # Comments act as token separators, like whitespace
+                if parts and parts[-1] != ' ':
+                    parts.append(' ')
+            elif kind == 'end':
+                statement = ''.join(parts).strip()
+                if statement:
+                    statements.append(statement)
+                parts = []
+            else:
+                parts.append(token.group())
         
-        # Split by semicolon and filter out empty statements
-        statements = [stmt.strip() for stmt in ddl_content.split(';') if stmt.strip()]
+        # Trailing statement without a semicolon
+        statement = ''.join(parts).strip()
+        if statement:
+            statements.append(statement)
         
         return statements
     
     def _extract_table_name(self, create_table_statement: str) -> Optional[str]:
         """Extract table name from CREATE TABLE statement"""
-        import re
-        match = re.search(r'CREATE\s+TABLE\s+(\w+)', create_table_statement, re.IGNORECASE)
+        match = CREATE_TABLE_PATTERN.search(create_table_statement)
         return match.group(1) if match else None
     
-    def _get_insertion_order(self, generated_data: Dict[str, pd.DataFrame], ddl_content: str = None) -> List[str]:
-        """Get insertion order for tables based on foreign key dependencies"""
+    def _get_table_dependencies(self, generated_data: Dict[str, pd.DataFrame], ddl_content: str = None,
+                                tables: Optional[List[Table]] = None) -> Optional[Dict[str, List[str]]]:
+        """Map each generated table to the tables it references (None if unknown).
+        
+        Referenced tables that were not generated are kept in the lists, so callers can tell
+        that the graph is incomplete.
+        """
         try:
-            if not ddl_content:
-                # No DDL provided, use alphabetical order
-                return sorted(generated_data.keys())
-            
-            # Parse DDL to extract foreign key relationships
-            from core.ddl_parser import DDLParser
-            parser = DDLParser()
-            tables = parser.parse_ddl(ddl_content)
+            if tables is None:
+                if not ddl_content:
+                    return None
+                
+                # Parse DDL to extract foreign key relationships
+                parser = DDLParser()
+                tables = parser.parse_ddl(ddl_content)
             
             # Build dependency graph
             dependencies = {}  # table -> list of tables it depends on
-            all_tables = set(generated_data.keys())
+            # Unquoted identifiers are case-insensitive, so REFERENCES Authors(id) points at authors
+            table_lookup = {name.lower(): name for name in generated_data}
             
             for table in tables:
-                if table.name in all_tables:
+                if table.name in generated_data:
+                    # Table-level FOREIGN KEY constraints and inline column REFERENCES
+                    parents = [fk_table for _, fk_table, _ in table.foreign_keys]
+                    parents.extend(column.foreign_table for column in table.columns if column.foreign_table)
+                    
                     dependencies[table.name] = []
-                    for fk_column, fk_table, fk_column_ref in table.foreign_keys:
-                        if fk_table in all_tables:
-                            dependencies[table.name].append(fk_table)
+                    for parent in parents:
+                        parent = table_lookup.get(parent.lower(), parent)
+                        if parent not in dependencies[table.name]:
+                            dependencies[table.name].append(parent)
+            
+            return dependencies
+            
+        except Exception as e:
+            logger.warning(f"Could not determine table dependencies: {e}")
+            return None
+    
+    def _get_insertion_plan(self, generated_data: Dict[str, pd.DataFrame], ddl_content: str = None,
+                            tables: Optional[List[Table]] = None) -> Tuple[Optional[Dict[str, List[str]]], List[str]]:
+        """Dependencies and insertion order, cached per DDL content and set of generated tables"""
+        key = None
+        if ddl_content:
+            key = (hashlib.blake2b(ddl_content.encode('utf-8')).hexdigest(), frozenset(generated_data))
+            cached = self._plan_cache.get(key)
+            if cached is not None:
+                dependencies, insertion_order = cached
+                return dependencies, list(insertion_order)
+        
+        dependencies = self._get_table_dependencies(generated_data, ddl_content, tables)
+        insertion_order = self._get_insertion_order(generated_data, dependencies=dependencies)
+        
+        if key is not None and dependencies is not None:
+            if len(self._plan_cache) >= INSERTION_PLAN_CACHE_SIZE:
+                # Evict the oldest plan
+                self._plan_cache.pop(next(iter(self._plan_cache)), None)
+            self._plan_cache[key] = (dependencies, list(insertion_order))
+        return dependencies, insertion_order
+    
+    def _get_insertion_order(self, generated_data: Dict[str, pd.DataFrame], ddl_content: str = None,
+                             tables: Optional[List[Table]] = None,
+                             dependencies: Optional[Dict[str, List[str]]] = None) -> List[str]:
+        """Get insertion order for tables based on foreign key dependencies"""
+        try:
+            if dependencies is None:
+                dependencies = self._get_table_dependencies(generated_data, ddl_content, tables)
+            if dependencies is None:
+                # No DDL provided, use alphabetical order
+                return sorted(generated_data.keys())
+            
+            all_tables = set(generated_data.keys())
             
             # Topological sort to get insertion order
             insertion_order = self._topological_sort(dependencies)
@@ -922,29 +1486,33 @@ class DatabaseManager:
     
     def _topological_sort(self, dependencies: Dict[str, List[str]]) -> List[str]:
         """Topological sort to determine insertion order based on dependencies"""
-        # Kahn's algorithm for topological sorting
+        # Kahn's algorithm over a reverse adjacency map: O(V + E)
         in_degree = {table: 0 for table in dependencies}
+        dependents: Dict[str, List[str]] = {table: [] for table in dependencies}
         
-        # Calculate in-degrees
         for table, deps in dependencies.items():
-            for dep in deps:
-                if dep in in_degree:
+            # Self-references do not constrain the order
+            for dep in set(deps):
+                if dep in in_degree and dep != table:
                     in_degree[table] += 1
+                    dependents[dep].append(table)
         
-        # Find nodes with no incoming edges
-        queue = [table for table, degree in in_degree.items() if degree == 0]
+        # Start from tables with no dependencies
+        queue = deque(table for table, degree in in_degree.items() if degree == 0)
         result = []
         
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             result.append(current)
             
-            # Remove current node and update in-degrees
-            for table, deps in dependencies.items():
-                if current in deps:
-                    in_degree[table] -= 1
-                    if in_degree[table] == 0:
-                        queue.append(table)
+            for table in dependents[current]:
+                in_degree[table] -= 1
+                if in_degree[table] == 0:
+                    queue.append(table)
+        
+        if len(result) != len(in_degree):
+            cyclic = [table for table, degree in in_degree.items() if degree > 0]
+            logger.warning(f"Circular foreign key dependencies between tables: {cyclic}")
         
         return result
     
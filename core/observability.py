@@ -1,18 +1,29 @@
 # core/observability.py
 import logging
+import queue
 import sys
+import threading
+import time
+import traceback
 import json
 from datetime import datetime
 from typing import Optional, Dict, Any
 from langfuse import Langfuse
 from config.settings import settings
 
+# Background log batching: flush after this many events or this many seconds
+LOG_BATCH_SIZE = 64
+LOG_BATCH_INTERVAL = 0.2
+
 class ObservabilityManager:
     """Manages logging and observability with Langfuse and comprehensive Docker logging"""
     
     def __init__(self):
         self.langfuse = None
         self.logger = self._setup_logging()
+        # Workflow events are written by a daemon thread so callers never block on logging
+        self._log_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        threading.Thread(target=self._drain_log_queue, name="observability-log", daemon=True).start()
         self._initialize_langfuse()
         self._log_startup()
     
@@ -226,15 +237,50 @@ class ObservabilityManager:
         
         # Log full traceback in debug mode
         if settings.DEBUG:
-            import traceback
             self.logger.debug(f"Full traceback:\n{traceback.format_exc()}")
     
     def log_workflow_step(self, workflow: str, step: str, status: str, **kwargs):
-        """Log workflow steps"""
-        context = " | ".join([f"{k}={v}" for k, v in kwargs.items()])
+        """Log workflow steps (queued, written in the background)"""
+        self.async_log({"workflow": workflow, "step": step, "status": status, **kwargs})
+    
+    def async_log(self, event: Dict[str, Any]):
+        """Queue a workflow event for the background writer"""
+        self._log_queue.put(event)
+    
+    def flush(self):
+        """Block until all queued events have been written"""
+        self._log_queue.join()
+    
+    def _write_workflow_step(self, event: Dict[str, Any]):
+        """Format and write one workflow event"""
+        event = dict(event)
+        workflow, step, status = event.pop("workflow"), event.pop("step"), event.pop("status")
+        context = " | ".join([f"{k}={v}" for k, v in event.items()])
         status_emoji = {"start": "🔄", "success": "✅", "error": "❌", "warning": "⚠️"}.get(status, "ℹ️")
         self.logger.info(f"{status_emoji} WORKFLOW | {workflow} | {step} | {status} | {context}")
     
+    def _drain_log_queue(self):
+        """Write queued events in batches of up to LOG_BATCH_SIZE or every LOG_BATCH_INTERVAL seconds"""
+        while True:
+            batch = [self._log_queue.get()]
+            deadline = time.monotonic() + LOG_BATCH_INTERVAL
+            while len(batch) < LOG_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._log_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            for event in batch:
+                try:
+                    self._write_workflow_step(event)
+                except Exception as e:
+                    self.logger.error(f"Failed to write workflow event: {str(e)}")
+                finally:
+                    self._log_queue.task_done()
+    
     def get_langfuse_client(self):
         """Get the Langfuse client instance"""
         return self.langfuse
@@ -4,13 +4,18 @@ Query generator coordinator.
 This module coordinates between SQL generation and AI responses.
 """
 
+import re
+import time
 import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 from typing import Optional, Dict, Any
 from langfuse import observe
+from config.settings import settings
 from core.ai_client import AIClient
 from core.observability import observability
+from core.data_generation_orchestrator import get_database_manager
+from utils.visualization import VisualizationManager
 
 
 class QueryGenerator:
@@ -32,7 +37,6 @@ class QueryGenerator:
             )
             
             prompt = self._create_sql_generation_prompt(natural_language_query, schema_info)
-            from config.settings import settings
             response = self.ai_client.generate_content(
                 prompt, 
                 temperature=0.1,
@@ -85,9 +89,9 @@ Database Schema:
         for table_name, table_info in schema_info.items():
             prompt += f"\nTable: {table_name}\n"
             prompt += "Columns:\n"
-            for col in table_info['columns']:
-                prompt += f"  - {col['name']}: {col['type']}"
-                if not col.get('nullable', True):
+            for name, col_type, nullable in zip(table_info['names'], table_info['types'], table_info['nullables']):
+                prompt += f"  - {name}: {col_type}"
+                if not nullable:
                     prompt += " (NOT NULL)"
                 prompt += "\n"
             
@@ -144,8 +148,6 @@ Generate the SQL query:
     def _validate_sql_against_schema(self, sql_query: str, schema_info: Dict[str, Any]) -> bool:
         """Validate that SQL query only uses columns that exist in the schema"""
         try:
-            import re
-            
             # Extract table names from FROM clause
             from_match = re.search(r'FROM\s+(\w+)', sql_query, re.IGNORECASE)
             if not from_match:
@@ -158,7 +160,7 @@ Generate the SQL query:
                 return False
             
             # Get available columns for this table
-            available_columns = [col['name'].lower() for col in schema_info[table_name]['columns']]
+            available_columns = [name.lower() for name in schema_info[table_name]['names']]
             
             # Extract column names from SELECT clause
             select_match = re.search(r'SELECT\s+(.*?)\s+FROM', sql_query, re.IGNORECASE | re.DOTALL)
@@ -192,9 +194,6 @@ Generate the SQL query:
     def execute_query(self, sql_query: str) -> Optional[pd.DataFrame]:
         """Execute SQL query against PostgreSQL database and return results"""
         try:
-            from core.database_manager import DatabaseManager
-            import time
-            
             start_time = time.time()
             
             # Log query execution start
@@ -206,7 +205,7 @@ Generate the SQL query:
             
             st.info("🔍 Executing SQL query against PostgreSQL database")
             
-            db_manager = DatabaseManager()
+            db_manager = get_database_manager()
             # Check if database is connected
             if not db_manager.is_connected():
                 observability.log_database_operation(
@@ -259,7 +258,6 @@ Generate the SQL query:
         """Generate AI response as a string"""
         try:
             conversational_prompt = self._create_conversational_prompt(prompt, context or {})
-            from config.settings import settings
             response = self.ai_client.generate_content(
                 conversational_prompt, 
                 temperature=0.7,
@@ -292,8 +290,8 @@ You have access to the following data context:
             prompt += "\nDatabase Schema:\n"
             for table_name, table_info in context['schema_info'].items():
                 prompt += f"- {table_name}:\n"
-                for col in table_info.get('columns', []):
-                    prompt += f"  - {col['name']}: {col['type']}\n"
+                for name, col_type in zip(table_info.get('names', []), table_info.get('types', [])):
+                    prompt += f"  - {name}: {col_type}\n"
         
         prompt += f"""
 User Query: {user_query}
@@ -345,7 +343,6 @@ Response:"""
             )
             
             prompt = self._create_visualization_generation_prompt(natural_language_query, schema_info)
-            from config.settings import settings
             response = self.ai_client.generate_content(
                 prompt, 
                 temperature=0.1,
@@ -398,9 +395,9 @@ Database Schema:
         for table_name, table_info in schema_info.items():
             prompt += f"\nTable: {table_name}\n"
             prompt += "Columns:\n"
-            for col in table_info['columns']:
-                prompt += f"  - {col['name']}: {col['type']}"
-                if not col.get('nullable', True):
+            for name, col_type, nullable in zip(table_info['names'], table_info['types'], table_info['nullables']):
+                prompt += f"  - {name}: {col_type}"
+                if not nullable:
                     prompt += " (NOT NULL)"
                 prompt += "\n"
             
@@ -448,8 +445,6 @@ Generate the SQL query for visualization:
     def create_visualization_from_query_results(self, query_results: pd.DataFrame, original_query: str) -> Optional[plt.Figure]:
         """Create visualization from SQL query results"""
         try:
-            from utils.visualization import VisualizationManager
-            
             viz_manager = VisualizationManager()
             
             # Determine chart type from original query
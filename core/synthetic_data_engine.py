@@ -8,22 +8,70 @@ This module handles the core synthetic data generation using AI models:
 4. Provides fallback data generation when AI fails
 """
 
+import functools
 import json
+import uuid
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import logging
 import random
 from datetime import datetime, timedelta
 from core.ddl_parser import Table, Column, DataType
 from core.ai_client import AIClient
+from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+SERIAL_TYPES = (DataType.SERIAL, DataType.BIGSERIAL)
+INTEGER_TYPES = (DataType.INTEGER, DataType.BIGINT, DataType.SMALLINT)
+
+# Vectorized generators for locally generated columns: (num_rows, rows_per_table, rng) -> values
+_COLUMN_BUILDERS: Dict[str, Callable] = {
+    "uuid": lambda num_rows, rows_per_table, rng: [str(uuid.uuid4()) for _ in range(num_rows)],
+    # Sequential IDs starting from 1
+    "sequence": lambda num_rows, rows_per_table, rng: np.arange(1, num_rows + 1),
+    # Foreign keys reference the sequential IDs 1..rows_per_table of the parent table
+    "reference": lambda num_rows, rows_per_table, rng: rng.integers(1, rows_per_table + 1, size=num_rows),
+}
+
+def _column_signature(table: Table) -> Tuple:
+    """Hashable description of the column attributes that decide how a table is generated"""
+    return tuple(
+        (column.name, column.data_type, column.is_primary_key, column.is_foreign_key)
+        for column in table.columns
+    )
+
+@functools.lru_cache(maxsize=128)
+def _deterministic_builder(signature: Tuple) -> Callable:
+    """Build (once per schema) a function generating all local columns of a table"""
+    plan = []
+    for name, data_type, is_primary_key, is_foreign_key in signature:
+        if data_type == DataType.UUID:
+            plan.append((name, _COLUMN_BUILDERS["uuid"]))
+        elif data_type in SERIAL_TYPES or (data_type in INTEGER_TYPES and is_primary_key):
+            plan.append((name, _COLUMN_BUILDERS["sequence"]))
+        elif data_type in INTEGER_TYPES and is_foreign_key:
+            plan.append((name, _COLUMN_BUILDERS["reference"]))
+    order = tuple(name for name, *_ in signature)
+    
+    def build(df: pd.DataFrame, rows_per_table: int, rng: np.random.Generator) -> pd.DataFrame:
+        num_rows = len(df)
+        for name, builder in plan:
+            df[name] = builder(num_rows, rows_per_table, rng)
+        # Keep DDL column order
+        ordered = [name for name in order if name in df.columns]
+        return df[ordered + [col for col in df.columns if col not in ordered]]
+    
+    return build
+
 class SyntheticDataEngine:
     """AI-powered engine for generating realistic synthetic data from table schemas"""
     
     def __init__(self):
         self.ai_client = AIClient()
+        # Whether the last generate_data call had to fall back to placeholder data
+        self.used_fallback = False
     
     def generate_data(self, tables: List[Table], generation_prompt: str = "", 
                      temperature: float = 0.3, rows_per_table: int = 50) -> Dict[str, pd.DataFrame]:
@@ -39,17 +87,32 @@ class SyntheticDataEngine:
         Returns:
             Dictionary mapping table names to DataFrames
         """
+        self.used_fallback = False
         try:
             generated_data = {}
             
-            # Generate data for each table
+            # Only tables with semantic columns need the AI; keys and UUIDs are generated locally
+            ai_tables = [table for table in tables if self._semantic_columns(table)]
+            
+            # Tables are generated independently, so send all prompts concurrently
+            logger.info(f"Generating data for tables: {[table.name for table in ai_tables]}")
+            prompts = [
+                self._create_data_generation_prompt(table, generation_prompt, rows_per_table)
+                for table in ai_tables
+            ]
+            responses = self.ai_client.generate_batch(
+                prompts,
+                temperature=temperature,
+                max_tokens=settings.MAX_DATA_GENERATION_TOKENS,
+                max_concurrency=settings.AI_MAX_CONCURRENCY
+            ) if prompts else []
+            responses_by_table = dict(zip([table.name for table in ai_tables], responses))
+            
             for table in tables:
-                logger.info(f"Generating data for table: {table.name}")
-                
-                # Generate data for this table
-                table_data = self._generate_table_data(
-                    table, generation_prompt, temperature, rows_per_table
-                )
+                if table.name in responses_by_table:
+                    table_data = self._parse_table_response(table, responses_by_table[table.name], rows_per_table)
+                else:
+                    table_data = self._add_deterministic_columns(pd.DataFrame(index=range(rows_per_table)), table, rows_per_table)
                 
                 if table_data is not None and not table_data.empty:
                     generated_data[table.name] = table_data
@@ -57,6 +120,7 @@ class SyntheticDataEngine:
                 else:
                     logger.error(f"Failed to generate data for table: {table.name}")
                     # Generate fallback data
+                    self.used_fallback = True
                     fallback_data = self._generate_fallback_data(table, rows_per_table)
                     if fallback_data is not None and not fallback_data.empty:
                         generated_data[table.name] = fallback_data
@@ -78,13 +142,22 @@ class SyntheticDataEngine:
             )
             
             # Generate data using AI
-            from config.settings import settings
             response = self.ai_client.generate_content(
                 prompt,
                 temperature=temperature,
                 max_tokens=settings.MAX_DATA_GENERATION_TOKENS
             )
             
+            return self._parse_table_response(table, response, rows_per_table)
+            
+        except Exception as e:
+            logger.error(f"Error generating data for table {table.name}: {e}")
+            return None
+    
+    def _parse_table_response(self, table: Table, response: Optional[str],
+                              rows_per_table: int) -> Optional[pd.DataFrame]:
+        """Convert an AI JSON response into a validated DataFrame for a table"""
+        try:
             if not response:
                 logger.error(f"No response received for table: {table.name}")
                 return None
@@ -93,8 +166,9 @@ class SyntheticDataEngine:
             cleaned_text = self._clean_json_response(response)
             data_json = json.loads(cleaned_text)
             
-            # Convert to DataFrame
+            # Convert to DataFrame and fill in the locally generated columns
             df = pd.DataFrame(data_json)
+            df = self._add_deterministic_columns(df, table, rows_per_table)
             
             # Validate and fix DataFrame
             df = self._validate_and_fix_dataframe(df, table)
@@ -108,6 +182,23 @@ class SyntheticDataEngine:
             logger.error(f"Error generating data for table {table.name}: {e}")
             return None
     
+    def _is_deterministic_column(self, column: Column) -> bool:
+        """Whether a column is generated locally instead of by the AI (serials, integer keys, UUIDs)"""
+        return (
+            column.data_type in SERIAL_TYPES
+            or column.data_type == DataType.UUID
+            or (column.data_type in INTEGER_TYPES and (column.is_primary_key or column.is_foreign_key))
+        )
+    
+    def _semantic_columns(self, table: Table) -> List[Column]:
+        """Columns whose values need the AI"""
+        return [column for column in table.columns if not self._is_deterministic_column(column)]
+    
+    def _add_deterministic_columns(self, df: pd.DataFrame, table: Table, rows_per_table: int) -> pd.DataFrame:
+        """Generate key and UUID columns with vectorized NumPy instead of the AI"""
+        build = _deterministic_builder(_column_signature(table))
+        return build(df, rows_per_table, np.random.default_rng())
+    
     def _create_data_generation_prompt(self, table: Table, generation_prompt: str, rows_per_table: int) -> str:
         """Create a prompt for data generation"""
         prompt_parts = [
@@ -118,7 +209,7 @@ class SyntheticDataEngine:
             "Columns:"
         ]
         
-        for column in table.columns:
+        for column in self._semantic_columns(table):
             col_info = f"  - {column.name}: {column.data_type.value}"
             if column.length:
                 col_info += f"({column.length})"
@@ -135,6 +226,12 @@ class SyntheticDataEngine:
             
             prompt_parts.append(col_info)
         
+        generated_columns = [column.name for column in table.columns if self._is_deterministic_column(column)]
+        if generated_columns:
+            prompt_parts.append(
+                f"Do NOT include these columns, they are generated automatically: {', '.join(generated_columns)}"
+            )
+        
         prompt_parts.extend([
             "",
             "CRITICAL REQUIREMENTS:",
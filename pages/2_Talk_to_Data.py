@@ -301,9 +301,10 @@ with st.sidebar:
     
     # Database connection status
     st.subheader("🗄️ Database Status")
-    from core.database_manager import DatabaseManager
+    # Same pooled manager the query generator uses, instead of a new engine per rerun
+    from core.data_generation_orchestrator import get_database_manager
     
-    db_manager = DatabaseManager()
+    db_manager = get_database_manager()
     if db_manager.is_connected():
         st.success("✅ PostgreSQL Connected")
         st.caption("SQL queries are executed against the PostgreSQL database.")
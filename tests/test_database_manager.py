@@ -0,0 +1,91 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("sqlalchemy")
+
+from core.database_manager import DatabaseManager
+from core.ddl_parser import DDLParser
+
+INLINE_REFERENCES_DDL = """
+CREATE TABLE authors (
+    author_id INTEGER PRIMARY KEY,
+    name VARCHAR(100) NOT NULL
+);
+
+CREATE TABLE books (
+    book_id INTEGER PRIMARY KEY,
+    author_id INTEGER REFERENCES authors(author_id),
+    title VARCHAR(200) NOT NULL
+);
+
+CREATE TABLE reviews (
+    review_id INTEGER PRIMARY KEY,
+    book_id INTEGER REFERENCES books(book_id),
+    rating INTEGER
+);
+"""
+
+
+@pytest.fixture
+def db_manager():
+    """DatabaseManager without a database connection (only the planning and scheduling logic is used)"""
+    manager = DatabaseManager.__new__(DatabaseManager)
+    manager.pool_size = 4
+    manager._plan_cache = {}
+    return manager
+
+
+def test_inline_references_become_dependencies(db_manager):
+    generated_data = {"reviews": None, "books": None, "authors": None}
+    tables = DDLParser().parse_ddl(INLINE_REFERENCES_DDL)
+
+    dependencies, insertion_order = db_manager._get_insertion_plan(generated_data, tables=tables)
+
+    assert dependencies == {"authors": [], "books": ["authors"], "reviews": ["books"]}
+    assert insertion_order == ["authors", "books", "reviews"]
+
+
+def test_parallel_insert_waits_for_inline_referenced_parents(db_manager):
+    generated_data = {"reviews": None, "books": None, "authors": None}
+    tables = DDLParser().parse_ddl(INLINE_REFERENCES_DDL)
+    dependencies, insertion_order = db_manager._get_insertion_plan(generated_data, tables=tables)
+
+    finished = []
+    lock = threading.Lock()
+
+    def fake_insert(table_name, dataframes, conn=None):
+        parents = dependencies[table_name]
+        with lock:
+            assert all(parent in finished for parent in parents), f"{table_name} started before {parents}"
+        time.sleep(0.01)
+        with lock:
+            finished.append(table_name)
+        return True
+
+    db_manager._insert_table = fake_insert
+    results = db_manager.insert_dataframes(generated_data, insertion_order, dependencies=dependencies)
+
+    assert results == {"authors": True, "books": True, "reviews": True}
+    assert finished == ["authors", "books", "reviews"]
+
+
+def test_reference_outside_load_falls_back_to_sequential(db_manager):
+    generated_data = {"reviews": None, "books": None}
+    tables = DDLParser().parse_ddl(INLINE_REFERENCES_DDL)
+    dependencies, insertion_order = db_manager._get_insertion_plan(generated_data, tables=tables)
+
+    assert dependencies["books"] == ["authors"]
+
+    threads = set()
+
+    def fake_insert(table_name, dataframes, conn=None):
+        threads.add(threading.get_ident())
+        return True
+
+    db_manager._insert_table = fake_insert
+    db_manager.insert_dataframes(generated_data, insertion_order, dependencies=dependencies)
+
+    assert threads == {threading.get_ident()}
@@ -0,0 +1,57 @@
+import io
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from utils.dataframe_utils import coerce_numeric_like, expand_categories
+
+
+def test_integer_column_rejects_fractional_values():
+    original = pd.Series([1, 2, 3], name="quantity")
+    edited = pd.Series([1.0, 2.5, 3.0])
+
+    with pytest.raises(ValueError):
+        coerce_numeric_like(edited, original)
+
+
+def test_integer_column_rejects_out_of_range_values():
+    original = pd.Series([1, 2, 3], name="quantity")
+    edited = pd.Series([1.0, 2.0 ** 63, 3.0])
+
+    with pytest.raises(ValueError):
+        coerce_numeric_like(edited, original)
+
+
+def test_float_column_keeps_original_for_missing_values():
+    original = pd.Series([1.5, 2.5, 3.5], name="price")
+    edited = pd.Series([9.99, None, 7.25])
+
+    result = coerce_numeric_like(edited, original)
+
+    assert result.dtype == "float64"
+    assert result.tolist() == [9.99, 2.5, 7.25]
+
+
+def test_non_numeric_edit_keeps_original_value():
+    pytest.importorskip("pyarrow")
+    original = pd.DataFrame({"item_id": [1, 2, 3], "quantity": [10, 20, 30]})
+    # Same parser settings as the AI table edit
+    csv_data = "item_id,quantity\n1,11\n2,lots\n3,33\n"
+    edited = pd.read_csv(io.BytesIO(csv_data.encode("utf-8")), engine="pyarrow",
+                         quotechar='"', escapechar="\\")
+
+    result = coerce_numeric_like(edited["quantity"], original["quantity"])
+
+    assert result.dtype == "int64"
+    assert result.tolist() == [11, 20, 33]
+
+
+def test_expanded_categories_accept_new_values():
+    df = pd.DataFrame({"genre": pd.Series(["fiction", "poetry", "fiction"], dtype="category")})
+
+    expanded = expand_categories(df)
+    expanded.loc[1, "genre"] = "drama"
+
+    assert df["genre"].dtype == "category"
+    assert expanded["genre"].tolist() == ["fiction", "drama", "fiction"]
@@ -0,0 +1,46 @@
+# utils/ai_response_cache.py
+import hashlib
+import os
+import shelve
+import threading
+from typing import Optional
+import pandas as pd
+from core.observability import observability
+
+class AIResponseCache:
+    """Disk-backed cache of raw AI responses keyed by the state that produced them"""
+
+    def __init__(self, cache_dir: str):
+        self.observability = observability
+        os.makedirs(cache_dir, exist_ok=True)
+        self._path = os.path.join(cache_dir, "responses")
+        # shelve is not thread-safe and Streamlit serves sessions from multiple threads
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def build_key(table_name: str, df: pd.DataFrame, prompt: str, temperature: float) -> str:
+        """Build a cache key from the table, its current data, the prompt and the temperature"""
+        data_hash = pd.util.hash_pandas_object(df, index=True).values.tobytes()
+        return hashlib.blake2b(b"|".join([
+            table_name.encode(),
+            data_hash,
+            prompt.encode(),
+            str(temperature).encode()
+        ])).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response, or None if missing"""
+        try:
+            with self._lock, shelve.open(self._path) as db:
+                return db.get(key)
+        except Exception as e:
+            self.observability.log_warning(f"AI response cache read failed: {str(e)}")
+            return None
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response"""
+        try:
+            with self._lock, shelve.open(self._path) as db:
+                db[key] = response
+        except Exception as e:
+            self.observability.log_warning(f"AI response cache write failed: {str(e)}")
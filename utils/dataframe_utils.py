@@ -0,0 +1,104 @@
+# utils/dataframe_utils.py
+from typing import TYPE_CHECKING
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    # Imported for annotations only - core imports this module, so a runtime import would be circular
+    from core.ddl_parser import Table
+
+# Narrowest pandas dtype implied by a DDL column type (keyed by DataType value)
+DDL_INTEGER_DTYPES = {
+    'SMALLINT': 'int16',
+    'INTEGER': 'int32',
+    'SERIAL': 'int32',
+    'BIGINT': 'int64',
+    'BIGSERIAL': 'int64',
+}
+DDL_FLOAT_DTYPES = {
+    'REAL': 'float32',
+    'DOUBLE_PRECISION': 'float64',
+}
+DDL_STRING_TYPES = ('VARCHAR', 'CHAR', 'TEXT')
+
+def compact_dataframe(df: pd.DataFrame, category_ratio: float = 0.5) -> pd.DataFrame:
+    """Downcast numeric columns and store repetitive string columns as category"""
+    compacted = df.copy(deep=False)
+    num_rows = len(df)
+
+    for col in df.select_dtypes(include=['int64', 'float64', 'object']).columns:
+        series = df[col]
+        if pd.api.types.is_integer_dtype(series):
+            compacted[col] = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_float_dtype(series):
+            compacted[col] = pd.to_numeric(series, downcast='float')
+        elif num_rows:
+            try:
+                if series.nunique(dropna=False) / num_rows < category_ratio:
+                    compacted[col] = series.astype('category')
+            except TypeError:
+                # Unhashable values (lists, dicts) cannot be categorized
+                continue
+
+    return compacted
+
+def expand_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert category columns back to object so they accept values outside their current categories"""
+    category_columns = df.select_dtypes(include='category').columns
+    if category_columns.empty:
+        return df
+
+    expanded = df.copy(deep=False)
+    for col in category_columns:
+        expanded[col] = expanded[col].astype(object)
+    return expanded
+
+def coerce_numeric_like(values: pd.Series, original: pd.Series) -> pd.Series:
+    """Convert edited values to the original numeric dtype, keeping the original value wherever the edit is not a number"""
+    coerced = pd.to_numeric(values, errors='coerce')
+    coerced = coerced.where(coerced.notna(), original.to_numpy())
+
+    if pd.api.types.is_integer_dtype(original):
+        result = coerced.astype('int64')
+        # Reject fractional or out-of-range values instead of silently truncating or wrapping them
+        if not (result.to_numpy() == coerced.to_numpy()).all():
+            raise ValueError(f"Column '{original.name}' has values that are not exact int64 integers")
+        return result
+
+    return coerced.astype('float64')
+
+def apply_schema_dtypes(df: pd.DataFrame, table: 'Table') -> pd.DataFrame:
+    """Store columns in the narrowest dtype their DDL type allows, then compact the rest"""
+    typed = df.copy(deep=False)
+
+    for column in table.columns:
+        if column.name not in typed.columns:
+            continue
+        series = typed[column.name]
+        data_type = column.data_type.value
+        try:
+            if data_type in DDL_INTEGER_DTYPES and not series.isna().any():
+                values = pd.to_numeric(series)
+                target = np.dtype(DDL_INTEGER_DTYPES[data_type])
+                limits = np.iinfo(target)
+                # Only narrow when every value is integral and in range
+                if (values % 1 == 0).all() and values.between(limits.min, limits.max).all():
+                    typed[column.name] = values.astype(target)
+            elif data_type in DDL_FLOAT_DTYPES:
+                typed[column.name] = pd.to_numeric(series).astype(DDL_FLOAT_DTYPES[data_type])
+        except (ValueError, TypeError):
+            # Values the AI produced do not fit the declared type; leave the column as-is
+            continue
+
+    typed = compact_dataframe(typed)
+
+    # Remaining free-text columns use Arrow-backed strings
+    for column in table.columns:
+        if column.data_type.value in DDL_STRING_TYPES and column.name in typed.columns \
+                and typed[column.name].dtype == object:
+            try:
+                typed[column.name] = typed[column.name].astype('string[pyarrow]')
+            except (ValueError, TypeError):
+                continue
+
+    return typed
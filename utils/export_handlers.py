@@ -5,6 +5,9 @@ import io
 from typing import Dict, Any, Optional
 from core.observability import observability
 
+# Write buffer size for export streams
+EXPORT_BUFFER_SIZE = 64 * 1024
+
 class ExportManager:
     """Manages data export functionality"""
     
@@ -16,24 +19,24 @@ class ExportManager:
         try:
             self.observability.log_info("Creating CSV export", tables=len(data_dict))
             
-            # Create a single CSV with all tables
-            csv_content = ""
+            # Write all tables into a single byte buffer, one table at a time
+            buffer = io.BytesIO()
             
             for table_name, df in data_dict.items():
                 # Add table header
-                csv_content += f"\n=== TABLE: {table_name} ===\n"
+                buffer.write(f"\n=== TABLE: {table_name} ===\n".encode('utf-8'))
                 
                 # Add table data
-                csv_content += df.to_csv(index=False)
-                csv_content += "\n"
+                df.to_csv(buffer, index=False, encoding='utf-8')
+                buffer.write(b"\n")
             
-            return csv_content.encode('utf-8')
+            return buffer.getvalue()
             
         except Exception as e:
             self.observability.log_error(f"CSV export failed: {str(e)}")
             raise e
     
-    def create_zip_export(self, data_dict: Dict[str, pd.DataFrame]) -> bytes:
+    def create_zip_export(self, data_dict: Dict[str, pd.DataFrame]) -> io.BytesIO:
         """Create ZIP archive of all tables as separate CSV files"""
         try:
             self.observability.log_info("Creating ZIP export", tables=len(data_dict))
@@ -43,14 +46,15 @@ class ExportManager:
             
             with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
                 for table_name, df in data_dict.items():
-                    # Create CSV content for this table
-                    csv_content = df.to_csv(index=False)
-                    
-                    # Add to ZIP file
-                    zip_file.writestr(f"{table_name}.csv", csv_content)
+                    # Stream CSV rows straight into the compressed entry in batches,
+                    # buffered so the compressor sees 64 KB writes instead of many small ones
+                    with zip_file.open(f"{table_name}.csv", 'w', force_zip64=True) as entry, \
+                            io.BufferedWriter(entry, buffer_size=EXPORT_BUFFER_SIZE) as buffered_entry, \
+                            io.TextIOWrapper(buffered_entry, encoding='utf-8', newline='') as text_entry:
+                        df.to_csv(text_entry, index=False, chunksize=10_000)
             
             zip_buffer.seek(0)
-            return zip_buffer.getvalue()
+            return zip_buffer
             
         except Exception as e:
             self.observability.log_error(f"ZIP export failed: {str(e)}")
@@ -0,0 +1,90 @@
+# utils/table_store.py
+import os
+import shutil
+import uuid
+import weakref
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Union
+import pandas as pd
+import streamlit as st
+from core.observability import observability
+from config.settings import settings
+
+# Bound on cached table loads; superseded file versions age out instead of piling up
+LOAD_TABLE_CACHE_ENTRIES = 64
+LOAD_TABLE_CACHE_TTL = 3600
+
+@st.cache_data(show_spinner=False, max_entries=LOAD_TABLE_CACHE_ENTRIES, ttl=LOAD_TABLE_CACHE_TTL)
+def load_table(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Load a stored table from Parquet (cached per file and column subset)"""
+    return pd.read_parquet(path, engine="pyarrow", columns=columns)
+
+class TableStore(MutableMapping):
+    """Dict-like store of generated tables persisted as Parquet files.
+
+    Only file paths are kept in session state; DataFrames are loaded on demand.
+    Tables that cannot be written to Parquet are kept in memory instead.
+    """
+
+    def __init__(self, base_dir: Optional[str] = None):
+        self._dir = os.path.join(base_dir or settings.TABLE_CACHE_DIR, uuid.uuid4().hex)
+        os.makedirs(self._dir, exist_ok=True)
+        # table name -> Parquet path, or DataFrame for in-memory fallback
+        self._entries: Dict[str, Union[str, pd.DataFrame]] = {}
+        # Remove the directory once the store is closed or its session is garbage-collected
+        self._cleanup = weakref.finalize(self, shutil.rmtree, self._dir, ignore_errors=True)
+
+    @classmethod
+    def from_tables(cls, tables: Dict[str, pd.DataFrame]) -> "TableStore":
+        """Create a store from a dictionary of DataFrames"""
+        store = cls()
+        store.update(tables)
+        return store
+
+    def __getitem__(self, table_name: str) -> pd.DataFrame:
+        entry = self._entries[table_name]
+        if isinstance(entry, pd.DataFrame):
+            return entry
+        return load_table(entry)
+
+    def __setitem__(self, table_name: str, df: pd.DataFrame) -> None:
+        # Every write gets a new file so cached loads of the old version never go stale
+        path = os.path.join(self._dir, f"{table_name}_{uuid.uuid4().hex[:8]}.parquet")
+        try:
+            df.to_parquet(path, engine="pyarrow", index=False)
+            entry = path
+        except Exception as e:
+            observability.log_warning(f"Could not store table {table_name} as Parquet, keeping it in memory: {str(e)}")
+            entry = df
+
+        self._remove_file(table_name)
+        self._entries[table_name] = entry
+
+    def __delitem__(self, table_name: str) -> None:
+        self._remove_file(table_name)
+        del self._entries[table_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def version(self, table_name: str) -> Optional[str]:
+        """Parquet path of the table's current version (None for in-memory tables)"""
+        entry = self._entries.get(table_name)
+        return entry if isinstance(entry, str) else None
+
+    def close(self) -> None:
+        """Delete every file of this store (called when the session's tables are replaced)"""
+        self._cleanup()
+        self._entries.clear()
+
+    def _remove_file(self, table_name: str) -> None:
+        """Remove the Parquet file currently backing a table"""
+        entry = self._entries.get(table_name)
+        if isinstance(entry, str):
+            try:
+                os.remove(entry)
+            except OSError:
+                pass